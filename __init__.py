@@ -9,11 +9,11 @@ from .cli import (
     calculate_grid_layout,
     get_place_list,
     load_grid_settings,
-    load_places,
     parse_args,
     parse_grid,
     parse_years,
 )
+from .config_manager import load_places
 from .geo_data.cds_base import CDS, Location
 from .geo_data.data_retrieval import RetrievalCoordinator
 from .geo_data.cache_store import CacheStore
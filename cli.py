@@ -8,15 +8,17 @@ from __future__ import annotations
 
 import argparse
 import difflib
+import functools
 import logging
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from geo_data.cds_base import Location
-from config_manager import load_places
 from geo_core.config import (
     CoreConfigService,
     VALID_COLOUR_MODES,
@@ -25,6 +27,9 @@ from geo_core.config import (
 from geo_core.formatting import condense_year_ranges
 from geo_core.grid import calculate_grid_layout as core_calculate_grid_layout
 
+if TYPE_CHECKING:
+    from geo_data.cds_base import Location
+
 logger = logging.getLogger("geo")
 
 __version__ = "1.0.0"
@@ -46,16 +51,23 @@ DEFAULT_MEASURE = VALID_MEASURES[0]
 DEFAULT_COLORMAP = "turbo"
 VALID_DOWNLOAD_BY = ("config", "month", "year", "compare")
 PLACE_DEFAULT_SENTINEL = "__default_place__"
+# Each number accepts what int() does for a non-negative value: surrounding
+# whitespace, a leading '+', digit-group underscores and any Unicode digits.
+_NUMBER = r"\s*\+?(\d+(?:_\d+)*)\s*"
+_YEARS_RE = re.compile(rf"{_NUMBER}(?:-{_NUMBER})?")
+_GRID_RE = re.compile(rf"{_NUMBER}[xX]{_NUMBER}")
 
 
-def _resolve_runtime_path_defaults() -> tuple[Path, dict[str, str]]:
+def _resolve_runtime_path_defaults(argv: list[str] | None = None) -> tuple[Path, dict[str, str]]:
     """Resolve config path and runtime path defaults from CLI pre-parse."""
+    if argv is None:
+        argv = sys.argv[1:]
     config_probe = argparse.ArgumentParser(add_help=False)
     config_probe.add_argument("--config", type=Path, default=Path("config.yaml"))
-    probe_args, _ = config_probe.parse_known_args()
+    probe_args, _ = config_probe.parse_known_args(argv)
     config_path = probe_args.config
 
-    if "--help" in sys.argv or "-h" in sys.argv:
+    if "--help" in argv or "-h" in argv:
         return config_path, {
             "cache_dir": "era5_cache",
             "data_cache_dir": "data_cache",
@@ -102,6 +114,17 @@ class FriendlyArgumentParser(argparse.ArgumentParser):
         raise CLIError(f"Argument error: {message}\n{usage}", hint=hint)
 
 
+def _parse_workers(value: str) -> int:
+    """Parse the --workers count, rejecting values below 1."""
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: '{value}'") from None
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"worker count must be at least 1, got {workers}")
+    return workers
+
+
 def _suggest_values(value: str, options: list[str], max_suggestions: int = 5) -> str | None:
     """Return a short suggestion string from close matches."""
     matches = difflib.get_close_matches(value, options, n=max_suggestions, cutoff=0.5)
@@ -153,16 +176,23 @@ def parse_measure_selection(measure_arg: str) -> list[str]:
     return resolved
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=4)
+def _build_parser(
+    prog: str,
+    config_path_default: Path,
+    runtime_path_items: tuple[tuple[str, str], ...],
+    current_year: int,
+) -> FriendlyArgumentParser:
     """
-    Parse command-line arguments for geo.
+    Build the geo argument parser.
 
-    Returns:
-        argparse.Namespace: Parsed command-line arguments.
+    Cached per set of baked-in defaults (program name, config path, runtime
+    paths, current year); argparse parsers can be reused across parse calls.
     """
-    config_path_default, runtime_paths = _resolve_runtime_path_defaults()
+    runtime_paths = dict(runtime_path_items)
 
     parser = FriendlyArgumentParser(
+        prog=prog,
         description="Generate geographic temperature plots from ERA5 data.",
         epilog="""
 Examples:
@@ -259,7 +289,6 @@ Examples:
 
     # Time period
     time_group = parser.add_argument_group("time period")
-    current_year = datetime.now().year
     time_group.add_argument(
         "-y", "--years",
         type=str,
@@ -370,8 +399,36 @@ Examples:
             "Default preserves existing cached values."
         ),
     )
+    advanced_group.add_argument(
+        "--workers",
+        type=_parse_workers,
+        default=1,
+        metavar="N",
+        help="Render batch plot pages in N worker processes (default: 1, serial)"
+    )
+
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments for geo.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:]).
+
+    Returns:
+        argparse.Namespace: Parsed command-line arguments.
+    """
+    config_path_default, runtime_paths = _resolve_runtime_path_defaults(argv)
+    parser = _build_parser(
+        os.path.basename(sys.argv[0]),
+        config_path_default,
+        tuple(runtime_paths.items()),
+        datetime.now().year,
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     args.measures = parse_measure_selection(args.measure)
     args.measure = args.measures[0]
     return args
@@ -395,33 +452,32 @@ def parse_years(years_str: str) -> tuple[int, int]:
             "--years argument is required.",
             "Use --years 2025 or --years 2020-2025."
         )
-    if '-' in years_str:
-        try:
-            if years_str.count('-') != 1:
-                raise ValueError()
-            start, end = years_str.split('-')
-            start_year = int(start)
-            end_year = int(end)
-            if start_year > end_year:
-                raise ValueError()
-        except ValueError:
+    match = _YEARS_RE.fullmatch(years_str)
+    if match is None:
+        if '-' in years_str:
             raise CLIError(
                 f"Invalid --years format: '{years_str}'.",
                 "Use YYYY or YYYY-YYYY with start <= end (for example: --years 2020-2025)."
             )
-    else:
-        try:
-            year = int(years_str)
-            start_year = year
-            end_year = year
-        except Exception:
-            raise CLIError(
-                f"Invalid --years format: '{years_str}'.",
-                "Use YYYY or YYYY-YYYY (for example: --years 2025 or --years 2020-2025)."
-            )
+        raise CLIError(
+            f"Invalid --years format: '{years_str}'.",
+            "Use YYYY or YYYY-YYYY (for example: --years 2025 or --years 2020-2025)."
+        )
+    start_year = int(match[1])
+    end_year = start_year if match[2] is None else int(match[2])
+    if start_year > end_year:
+        raise CLIError(
+            f"Invalid --years format: '{years_str}'.",
+            "Use YYYY or YYYY-YYYY with start <= end (for example: --years 2020-2025)."
+        )
     return start_year, end_year
 
 
+def _resolve_place_names(place_names: list[str], places: dict[str, Location]) -> list[Location]:
+    """Map list entries to configured Locations in list order, skipping unknown names (one dict probe each)."""
+    return [location for name in place_names if (location := places.get(name)) is not None]
+
+
 def get_place_list(args: argparse.Namespace, places: dict[str, Location], default_place: str, place_lists: dict[str, list[str]]) -> tuple[list[Location], str | None]:
     """
     Determine the list of places to process based on command-line arguments.
@@ -461,8 +517,7 @@ def get_place_list(args: argparse.Namespace, places: dict[str, Location], defaul
                 f"Unknown place list '{args.place_list}'.",
                 hint
             )
-        place_names = place_lists[args.place_list]
-        return [places[name] for name in place_names if name in places], args.place_list
+        return _resolve_place_names(place_lists[args.place_list], places), args.place_list
 
     # --place uses a specific place
     if args.place:
@@ -491,6 +546,8 @@ def get_place_list(args: argparse.Namespace, places: dict[str, Location], defaul
                 hint
             )
         # Create custom location (tz will auto-detect if not provided)
+        from geo_data.cds_base import Location
+
         if args.tz:
             return [Location(name=args.place, lat=args.lat, lon=args.lon, tz=args.tz)], None
         else:
@@ -516,8 +573,7 @@ def get_place_runs(
     if args.place_list == "all":
         runs: list[tuple[list[Location], str | None]] = []
         for list_name in sorted(place_lists.keys()):
-            place_names = place_lists[list_name]
-            selected_places = [places[name] for name in place_names if name in places]
+            selected_places = _resolve_place_names(place_lists[list_name], places)
             if selected_places:
                 runs.append((selected_places, list_name))
 
@@ -554,20 +610,15 @@ def parse_grid(grid_str: str | None) -> tuple[int, int] | None:
             "Use COLSxROWS (e.g., --grid 4x3 for 4 columns by 3 rows)."
         )
 
-    try:
-        parts = grid_str.lower().split('x')
-        if len(parts) != 2:
-            raise ValueError()
-        cols = int(parts[0])  # X = horizontal = columns
-        rows = int(parts[1])  # Y = vertical = rows
-        if rows <= 0 or cols <= 0:
-            raise ValueError()
-        return (rows, cols)
-    except ValueError:
+    match = _GRID_RE.fullmatch(grid_str)
+    cols = int(match[1]) if match else 0  # X = horizontal = columns
+    rows = int(match[2]) if match else 0  # Y = vertical = rows
+    if rows <= 0 or cols <= 0:
         raise CLIError(
             f"Invalid grid format '{grid_str}'.",
             "Use COLSxROWS with positive integers (e.g., --grid 4x3)."
         )
+    return (rows, cols)
 
 
 def load_grid_settings(config_file: Path) -> tuple[int, int]:
@@ -680,6 +731,8 @@ def calculate_grid_layout(num_places: int, max_rows: int = 4, max_cols: int = 6)
 
 def build_places_report() -> str:
     """Build a formatted report of available places and place lists."""
+    from config_manager import load_places
+
     places, default_place, place_lists = load_places()
     lines: list[str] = []
 
@@ -704,6 +757,8 @@ def build_places_report() -> str:
 
 def build_places_only_report() -> str:
     """Build a formatted report of configured places only."""
+    from config_manager import load_places
+
     places, default_place, _place_lists = load_places()
     lines: list[str] = []
 
@@ -721,6 +776,8 @@ def build_places_only_report() -> str:
 
 def build_place_lists_report() -> str:
     """Build a formatted report of predefined place lists only."""
+    from config_manager import load_places
+
     _places, _default_place, place_lists = load_places()
     lines: list[str] = []
 
@@ -758,6 +815,7 @@ def list_place_lists_and_exit() -> None:
 
 def build_cached_years_report(data_cache_dir: Path = Path("data_cache")) -> str:
     """Build a formatted report of cached years by place."""
+    from config_manager import load_places
     from geo_data.cache_store import CacheStore
 
     places, _default_place, _place_lists = load_places()
@@ -15,6 +15,9 @@ from timezonefinder import TimezoneFinder
 
 from geo_data.cds_base import Location
 from geo_core.config import (
+    _SAFE_DUMPER,
+    _read_config_yaml,
+    _yaml_safe_load,
     extract_places_config,
     find_place_by_name,
     render_config_yaml,
@@ -35,14 +38,16 @@ def load_places(yaml_path: Path = Path("config.yaml")) -> tuple[dict, str, dict]
     """
     Load places configuration from YAML.
 
+    Both the config file and an externalized places file go through the shared
+    config YAML cache, so repeated loads only re-parse files that have changed.
+
     Args:
         yaml_path: Path to the configuration YAML file.
 
     Returns:
         tuple: (places_dict, default_place_name, place_lists_dict)
     """
-    with open(yaml_path, "r") as f:
-        config = yaml.safe_load(f) or {}
+    config = _read_config_yaml(yaml_path)
 
     if isinstance(config.get('places'), dict):
         places_source = {'places': config['places']}
@@ -50,8 +55,7 @@ def load_places(yaml_path: Path = Path("config.yaml")) -> tuple[dict, str, dict]
         places_file_path = _resolve_places_file_path(config, yaml_path)
         if not places_file_path.exists():
             raise FileNotFoundError(f"Places file not found: {places_file_path}")
-        with open(places_file_path, "r") as places_file:
-            places_source = yaml.safe_load(places_file) or {}
+        places_source = _read_config_yaml(places_file_path)
 
     all_places, default_place, place_lists = extract_places_config(places_source)
     places_dict = {p['name']: Location(**p) for p in all_places}
@@ -113,7 +117,7 @@ def add_place_to_config(place_name: str, config_path: Path = Path("config.yaml")
 
         # Load existing config
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f) or {}
+            config = _yaml_safe_load(f)
 
         places_file_path = None
         if isinstance(config.get('places'), dict):
@@ -123,7 +127,7 @@ def add_place_to_config(place_name: str, config_path: Path = Path("config.yaml")
             places_file_path = _resolve_places_file_path(config, config_path)
             if places_file_path.exists():
                 with open(places_file_path, "r") as places_file:
-                    loaded_places = yaml.safe_load(places_file) or {}
+                    loaded_places = _yaml_safe_load(places_file)
             else:
                 loaded_places = {}
             if isinstance(loaded_places.get('places'), dict):
@@ -161,7 +165,7 @@ def add_place_to_config(place_name: str, config_path: Path = Path("config.yaml")
         else:
             places_file_path.parent.mkdir(parents=True, exist_ok=True)
             with open(places_file_path, "w") as places_file:
-                yaml.safe_dump(places_payload, places_file, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                yaml.dump(places_payload, places_file, Dumper=_SAFE_DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True)
             saved_path = places_file_path
 
         print(f"\n✓ Added '{place_name}' to {saved_path}")
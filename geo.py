@@ -188,7 +188,8 @@ def _run_standard_pipeline(args, ctx) -> int:
                 list_name,
                 measure,
                 ctx['colour_mode'],
-                ctx['colormap_name']
+                ctx['colormap_name'],
+                max_workers=args.workers,
             )
     return 0
 
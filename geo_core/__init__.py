@@ -13,11 +13,12 @@ from .config import (
 )
 from .formatting import condense_year_ranges
 from .grid import calculate_grid_layout
-from .progress import ProgressHandler, ProgressManager, get_progress_manager
+from .progress import ConsoleProgressHandler, ProgressHandler, ProgressManager, get_progress_manager
 
 __all__ = [
     "calculate_grid_layout",
     "condense_year_ranges",
+    "ConsoleProgressHandler",
     "CoreConfigService",
     "extract_places_config",
     "find_place_by_name",
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
+import os
 from pathlib import Path
 
 import yaml
@@ -22,6 +25,38 @@ from .constants import (
 logger = logging.getLogger("geo")
 
 
+try:
+    _SAFE_LOADER = yaml.CSafeLoader
+    _SAFE_DUMPER = yaml.CSafeDumper
+except AttributeError:
+    _SAFE_LOADER = yaml.SafeLoader
+    _SAFE_DUMPER = yaml.SafeDumper
+
+
+def _yaml_safe_load(stream):
+    """Load YAML using fastest available safe loader."""
+    return yaml.load(stream, Loader=_SAFE_LOADER) or {}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config YAML file once per (path, mtime, size) within this process."""
+    with open(path, 'r') as f:
+        return _yaml_safe_load(f)
+
+
+def _read_config_yaml(config_path: Path) -> dict:
+    """
+    Load a config YAML file, re-parsing only when the file changes.
+
+    The CLI reads the same config.yaml for grid, colour, text, path, retrieval and
+    measure settings; each call gets its own deep copy of the cached document.
+    """
+    path = os.path.realpath(config_path)
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_config_yaml(path, stat.st_mtime_ns, stat.st_size))
+
+
 class CoreConfigService:
     """Stateful access wrapper for core config helpers."""
 
@@ -29,8 +64,7 @@ class CoreConfigService:
         self.config_file = config_file
 
     def load_grid_settings(self) -> tuple[int, int]:
-        with open(self.config_file, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = _read_config_yaml(self.config_file)
 
         grid_config = config.get('grid', {})
         if not isinstance(grid_config, dict):
@@ -51,8 +85,7 @@ class CoreConfigService:
             return cli_colour_mode
 
         default_mode = DEFAULT_COLOUR_MODE
-        with open(self.config_file, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = _read_config_yaml(self.config_file)
 
         plotting = config.get('plotting', {})
         if not isinstance(plotting, dict):
@@ -68,8 +101,7 @@ class CoreConfigService:
         return config_mode
 
     def load_colormap(self) -> str:
-        with open(self.config_file, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = _read_config_yaml(self.config_file)
 
         plotting_config = config.get('plotting', {})
         if not isinstance(plotting_config, dict):
@@ -137,8 +169,7 @@ class CoreConfigService:
 
 def load_plot_text_config(config_path: Path = Path("config.yaml")) -> dict:
     """Load and validate required plot text templates from config file."""
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f) or {}
+    config = _read_config_yaml(config_path)
 
     plot_text = config.get('plot_text')
     if not isinstance(plot_text, dict):
@@ -175,8 +206,7 @@ def load_runtime_paths(config_file: Path = Path("config.yaml")) -> dict[str, str
     """
     paths = DEFAULT_RUNTIME_PATHS.copy()
 
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f) or {}
+    config = _read_config_yaml(config_file)
 
     runtime_paths = config.get('runtime_paths', {})
     if not isinstance(runtime_paths, dict):
@@ -200,8 +230,7 @@ def load_retrieval_settings(config_file: Path = Path("config.yaml")) -> dict[str
     """
     settings = DEFAULT_RETRIEVAL_SETTINGS.copy()
 
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f) or {}
+    config = _read_config_yaml(config_file)
 
     retrieval = config.get('retrieval', {})
     if not isinstance(retrieval, dict):
@@ -348,8 +377,7 @@ def load_measures_config(config_path: Path = Path("config.yaml")) -> dict[str, d
 
     Key: ``plotting.measures``.
     """
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f) or {}
+    config = _read_config_yaml(config_path)
 
     plotting = config.get('plotting')
     if not isinstance(plotting, dict):
@@ -612,8 +640,9 @@ def render_config_yaml(config: dict) -> str:
     for section_name, section_data in config.items():
         if section_name not in handled_sections:
             lines.append(f"# {section_name.replace('_', ' ').title()} section")
-            section_yaml = yaml.safe_dump(
+            section_yaml = yaml.dump(
                 {section_name: section_data},
+                Dumper=_SAFE_DUMPER,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -2,30 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import math
 
 
-def calculate_grid_layout(num_places: int, max_rows: int = 4, max_cols: int = 6) -> tuple[int, int]:
-    """
-    Calculate optimal grid layout (rows, columns) for subplot arrangement.
-
-    Prioritizes balanced aspect ratio while limiting maximum grid size for readability.
-    If places exceed max capacity, they should be batched into multiple images.
-
-    Args:
-        num_places: Number of subplots to arrange.
-        max_rows: Maximum number of rows allowed (default 4).
-        max_cols: Maximum number of columns allowed (default 6).
-
-    Returns:
-        tuple[int, int]: (num_rows, num_cols) for the grid layout.
-    """
-    if num_places == 0:
-        return (1, 1)
-
-    max_grid_size = max_rows * max_cols
-    places_to_fit = min(num_places, max_grid_size)
-
+@functools.lru_cache(maxsize=256)
+def _compute_grid_layout(places_to_fit: int, max_rows: int, max_cols: int) -> tuple[int, int]:
+    """Search for a balanced (rows, cols) layout holding ``places_to_fit`` subplots."""
     if places_to_fit <= 2:
         return (1, places_to_fit)
     if places_to_fit <= 4:
@@ -50,3 +33,25 @@ def calculate_grid_layout(num_places: int, max_rows: int = 4, max_cols: int = 6)
             return (rows, cols)
 
     return (num_rows, num_cols)
+
+
+def calculate_grid_layout(num_places: int, max_rows: int = 4, max_cols: int = 6) -> tuple[int, int]:
+    """
+    Calculate optimal grid layout (rows, columns) for subplot arrangement.
+
+    Prioritizes balanced aspect ratio while limiting maximum grid size for readability.
+    If places exceed max capacity, they should be batched into multiple images.
+
+    Args:
+        num_places: Number of subplots to arrange.
+        max_rows: Maximum number of rows allowed (default 4).
+        max_cols: Maximum number of columns allowed (default 6).
+
+    Returns:
+        tuple[int, int]: (num_rows, num_cols) for the grid layout.
+    """
+    if num_places == 0:
+        return (1, 1)
+
+    places_to_fit = min(num_places, max_rows * max_cols)
+    return _compute_grid_layout(places_to_fit, max_rows, max_cols)
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import sys
+import time
 from typing import Protocol
 
 
@@ -65,37 +69,68 @@ class ProgressHandler(Protocol):
 class ProgressManager:
     """Manages progress event handlers and dispatches events."""
 
+    _EVENTS = (
+        "on_location_start",
+        "on_year_start",
+        "on_year_complete",
+        "on_location_complete",
+        "on_month_start",
+        "on_month_complete",
+        "on_stage_progress",
+        "on_stage_complete",
+    )
+
     def __init__(self) -> None:
         """Initialize the progress manager."""
         self.handlers: list[ProgressHandler] = []
+        self._callbacks: dict[str, tuple] = {}
+        self._rebuild_callbacks()
+
+    def _rebuild_callbacks(self) -> None:
+        """
+        Resolve each event to a tuple of bound handler methods (handlers may omit optional events).
+
+        The ``notify_*`` methods stay the only entry points whatever the handler count,
+        so every handler is called positionally with the same fixed argument order.
+        """
+        self._callbacks = {
+            event: tuple(
+                callback
+                for callback in (getattr(handler, event, None) for handler in self.handlers)
+                if callable(callback)
+            )
+            for event in self._EVENTS
+        }
 
     def register_handler(self, handler: ProgressHandler) -> None:
         """Register a progress handler."""
         self.handlers.append(handler)
+        self._rebuild_callbacks()
 
     def clear_handlers(self) -> None:
         """Remove all registered handlers."""
         self.handlers.clear()
+        self._rebuild_callbacks()
 
     def notify_location_start(self, location_name: str, location_num: int, total_locations: int, total_years: int = 1) -> None:
         """Notify all handlers that location processing started."""
-        for handler in self.handlers:
-            handler.on_location_start(location_name, location_num, total_locations, total_years)
+        for callback in self._callbacks["on_location_start"]:
+            callback(location_name, location_num, total_locations, total_years)
 
     def notify_year_start(self, location_name: str, year: int, current_year: int, total_years: int) -> None:
         """Notify all handlers that year processing started."""
-        for handler in self.handlers:
-            handler.on_year_start(location_name, year, current_year, total_years)
+        for callback in self._callbacks["on_year_start"]:
+            callback(location_name, year, current_year, total_years)
 
     def notify_year_complete(self, location_name: str, year: int, current_year: int, total_years: int) -> None:
         """Notify all handlers that year processing completed."""
-        for handler in self.handlers:
-            handler.on_year_complete(location_name, year, current_year, total_years)
+        for callback in self._callbacks["on_year_complete"]:
+            callback(location_name, year, current_year, total_years)
 
     def notify_location_complete(self, location_name: str) -> None:
         """Notify all handlers that location processing completed."""
-        for handler in self.handlers:
-            handler.on_location_complete(location_name)
+        for callback in self._callbacks["on_location_complete"]:
+            callback(location_name)
 
     def notify_month_start(
         self,
@@ -106,10 +141,8 @@ class ProgressManager:
         total_months: int,
     ) -> None:
         """Notify handlers that month processing started (if supported)."""
-        for handler in self.handlers:
-            month_start = getattr(handler, "on_month_start", None)
-            if callable(month_start):
-                month_start(location_name, year, month, current_month, total_months)
+        for callback in self._callbacks["on_month_start"]:
+            callback(location_name, year, month, current_month, total_months)
 
     def notify_month_complete(
         self,
@@ -120,10 +153,8 @@ class ProgressManager:
         total_months: int,
     ) -> None:
         """Notify handlers that month processing completed (if supported)."""
-        for handler in self.handlers:
-            month_complete = getattr(handler, "on_month_complete", None)
-            if callable(month_complete):
-                month_complete(location_name, year, month, current_month, total_months)
+        for callback in self._callbacks["on_month_complete"]:
+            callback(location_name, year, month, current_month, total_months)
 
     def notify_stage_progress(
         self,
@@ -134,17 +165,248 @@ class ProgressManager:
         detail: str | None = None,
     ) -> None:
         """Notify handlers about generic one-line stage progress (if supported)."""
-        for handler in self.handlers:
-            stage_progress = getattr(handler, "on_stage_progress", None)
-            if callable(stage_progress):
-                stage_progress(stage_label, item_label, current_item, total_items, detail)
+        for callback in self._callbacks["on_stage_progress"]:
+            callback(stage_label, item_label, current_item, total_items, detail)
 
     def notify_stage_complete(self, stage_label: str) -> None:
         """Notify handlers that generic one-line stage progress is complete (if supported)."""
-        for handler in self.handlers:
-            stage_complete = getattr(handler, "on_stage_complete", None)
-            if callable(stage_complete):
-                stage_complete(stage_label)
+        for callback in self._callbacks["on_stage_complete"]:
+            callback(stage_label)
+
+
+def _bar_strings(width: int) -> tuple[str, ...]:
+    """Return every fill state of a progress bar of the given width."""
+    return tuple('█' * filled + '░' * (width - filled) for filled in range(width + 1))
+
+
+@functools.lru_cache(maxsize=32)
+def _bar_segments(width: int, total: int) -> tuple[tuple[int, str], ...]:
+    """Return (filled cells, "[bar] pct%") for every progress count 0..total."""
+    bars = _bar_strings(width)
+    segments = []
+    for count in range(total + 1):
+        filled = min(width * count // total, width)
+        segments.append((filled, f"[{bars[filled]}] {100 * count // total}%"))
+    return tuple(segments)
+
+
+class ConsoleProgressHandler:
+    """Console-based progress handler with progress bars."""
+
+    # Bar widths in cells; "[bar] pct%" segments are prebuilt per (width, total) by _bar_segments
+    _STAGE_BAR_WIDTH = 16
+    _YEAR_BAR_WIDTH = 12
+    _MONTH_BAR_WIDTH = 10
+    # Minimum seconds between unforced redraws; TTY flushes can dominate fast month loops
+    MIN_RENDER_INTERVAL = 0.05
+    # Set to "1" to draw live progress bars even when stdout is not a terminal
+    FORCE_PROGRESS_ENV = "GEO_FORCE_PROGRESS"
+    # Clock used for redraw throttling; tests can replace it per instance
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self) -> None:
+        # Pipes/CI logs get one final line per location or stage instead of live redraws
+        isatty = getattr(sys.stdout, "isatty", None)
+        self._interactive = os.environ.get(self.FORCE_PROGRESS_ENV) == "1" or bool(isatty and isatty())
+        self._active_year_index = 1
+        self._active_total_years = 1
+        self._last_render = float('-inf')
+        self._pending_line: str | None = None
+        self._last_filled: tuple | None = None
+        # Constant head of each location line ("\r  Place i/N <name padded> - Year "), built per location
+        self._place_prefix = ""
+        self._location_name: str | None = None
+        self._line_prefix = ""
+
+    def _set_line_prefix(self, location_name: str) -> None:
+        """Cache the constant start of progress lines for a location."""
+        self._location_name = location_name
+        self._line_prefix = f"\r  {self._place_prefix}{location_name:<30} - Year "
+
+    def _write_line(self, line: str, force: bool = False, filled: tuple | None = None) -> None:
+        """
+        Queue a carriage-return progress line, writing at most every MIN_RENDER_INTERVAL.
+
+        Each line overwrites the previous one on the terminal, so only the newest
+        pending line is kept. Forced writes, and updates whose filled bar cells
+        differ from the last drawn line, are written immediately.
+        """
+        self._pending_line = line
+        if not self._interactive:
+            return
+        now = self._clock()
+        if force or filled != self._last_filled or now - self._last_render >= self.MIN_RENDER_INTERVAL:
+            self._last_render = now
+            self._last_filled = filled
+            self._flush_line()
+
+    def _flush_line(self, end: str = "") -> None:
+        """
+        Write and flush any pending progress line (plus ``end``) in a single write call.
+
+        sys.stdout is looked up per call rather than bound once, so redirected or
+        captured streams are honoured.
+        """
+        line = self._pending_line
+        if line is not None and not self._interactive:
+            line = line.lstrip("\r")
+        text = end if line is None else line + end
+        self._pending_line = None
+        if text:
+            stdout = sys.stdout
+            stdout.write(text)
+            stdout.flush()
+
+    def _render_stage_progress_line(
+        self,
+        stage_label: str,
+        item_label: str,
+        current_item: int,
+        total_items: int,
+        detail: str | None = None,
+    ) -> None:
+        """Render a single-line generic stage progress bar."""
+        total = max(total_items, 1)
+        current = min(max(current_item, 0), total)
+        filled, segment = _bar_segments(self._STAGE_BAR_WIDTH, total)[current]
+        detail_suffix = f" | {detail}" if detail else ""
+        line = (
+            f"\r  {stage_label:<12} {current}/{total} {item_label:<30} "
+            f"{segment}{detail_suffix}"
+        )
+        self._write_line(line, force=current == total, filled=(filled,))
+
+    def _render_progress_line(
+        self,
+        location_name: str,
+        year: int | None,
+        completed_years: int,
+        total_years: int,
+        *,
+        month: int | None = None,
+        completed_months: int | None = None,
+        total_months: int | None = None,
+        force: bool = False,
+    ) -> None:
+        completed_years = min(max(completed_years, 0), total_years)
+        year_filled, year_segment = _bar_segments(self._YEAR_BAR_WIDTH, total_years)[completed_years]
+        month_filled = None
+
+        if location_name != self._location_name:
+            self._set_line_prefix(location_name)
+
+        year_context = f" ({year})" if year is not None else ""
+        line = f"{self._line_prefix}{completed_years}/{total_years}{year_context}: {year_segment}"
+
+        if month is not None and completed_months is not None and total_months is not None:
+            completed_months = min(max(completed_months, 0), total_months)
+            month_filled, month_segment = _bar_segments(self._MONTH_BAR_WIDTH, total_months)[completed_months]
+            line += f" | Month {completed_months}/{total_months} ({month:02d}): {month_segment}"
+
+        self._write_line(line, force=force, filled=(year_filled, month_filled))
+
+    def on_location_start(self, location_name: str, location_num: int, total_locations: int, total_years: int = 1) -> None:
+        """Display location start message."""
+        self._place_prefix = f"Place {location_num}/{total_locations} "
+        self._set_line_prefix(location_name)
+        self._active_year_index = 1
+        self._active_total_years = total_years
+        self._render_progress_line(
+            location_name,
+            None,
+            0,
+            total_years,
+            force=True,
+        )
+
+    def on_year_start(self, location_name: str, year: int, current_year: int, total_years: int) -> None:
+        """Display initial progress bar for the year."""
+        self._active_year_index = current_year
+        self._active_total_years = total_years
+        self._render_progress_line(
+            location_name,
+            year,
+            current_year - 1,
+            total_years,
+        )
+
+    def on_year_complete(self, location_name: str, year: int, current_year: int, total_years: int) -> None:
+        """Update the progress bar after year completes."""
+        self._render_progress_line(
+            location_name,
+            year,
+            current_year,
+            total_years,
+            force=True,
+        )
+
+    def on_month_start(
+        self,
+        location_name: str,
+        year: int,
+        month: int,
+        current_month: int,
+        total_months: int,
+    ) -> None:
+        """Display month progress while preserving year progress on same line."""
+        year_idx = self._active_year_index
+        total_years = self._active_total_years
+        self._render_progress_line(
+            location_name,
+            year,
+            year_idx - 1,
+            total_years,
+            month=month,
+            completed_months=current_month - 1,
+            total_months=total_months,
+        )
+
+    def on_month_complete(
+        self,
+        location_name: str,
+        year: int,
+        month: int,
+        current_month: int,
+        total_months: int,
+    ) -> None:
+        """Update month progress while preserving year progress on same line."""
+        year_idx = self._active_year_index
+        total_years = self._active_total_years
+        self._render_progress_line(
+            location_name,
+            year,
+            year_idx - 1,
+            total_years,
+            month=month,
+            completed_months=current_month,
+            total_months=total_months,
+            force=True,
+        )
+
+    def on_location_complete(self, location_name: str) -> None:
+        """Location processing complete - move to next line."""
+        self._flush_line("\n")
+
+    def on_stage_progress(
+        self,
+        stage_label: str,
+        item_label: str,
+        current_item: int,
+        total_items: int,
+        detail: str | None = None,
+    ) -> None:
+        """Display generic single-line stage progress updates."""
+        self._render_stage_progress_line(
+            stage_label,
+            item_label,
+            current_item,
+            total_items,
+            detail,
+        )
+
+    def on_stage_complete(self, stage_label: str) -> None:
+        """Finalize generic stage progress line."""
+        self._flush_line("\n")
 
 
 _progress_manager = ProgressManager()
@@ -757,3 +757,27 @@ def test_get_plot_text_missing_placeholder_raises():
 
     with pytest.raises(ValueError):
         get_plot_text(config, "overall_title", measure_label="Temp", start_year=2020)
+
+
+def test_config_yaml_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    import geo_core.config as core_config
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("grid:\n  max_auto_rows: 3\n  max_auto_cols: 5\nplotting:\n  colour_mode: year\n")
+    parses = []
+    real_safe_load = core_config._yaml_safe_load
+    monkeypatch.setattr(core_config, "_yaml_safe_load", lambda f: parses.append(f.name) or real_safe_load(f))
+
+    service = CoreConfigService(config_file)
+    assert service.load_grid_settings() == (3, 5)
+    assert service.load_colour_mode() == "year"
+    assert len(parses) == 1
+
+    config_file.write_text("grid:\n  max_auto_rows: 2\n  max_auto_cols: 5\nplotting:\n  colour_mode: year\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert service.load_grid_settings() == (2, 5)
+    assert len(parses) == 2
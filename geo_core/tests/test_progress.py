@@ -264,3 +264,63 @@ def test_progress_manager_notify_month_events_ignores_handlers_without_month_met
 
     manager.notify_month_start("Test City", 2024, 1, 1, 12)
     manager.notify_month_complete("Test City", 2024, 1, 1, 12)
+
+
+def test_progress_manager_notify_location_start_calls_each_handler_once():
+    manager = ProgressManager()
+    calls = []
+
+    class RecordingHandler:
+        def on_location_start(self, location_name, location_num, total_locations, total_years=1):
+            calls.append((location_name, location_num, total_locations, total_years))
+
+    manager.register_handler(RecordingHandler())
+    manager.notify_location_start("Test City", 2, 5, total_years=3)
+
+    assert calls == [("Test City", 2, 5, 3)]
+
+
+def test_progress_manager_stops_dispatch_after_clear_handlers():
+    manager = ProgressManager()
+    calls = []
+
+    class RecordingHandler:
+        def on_location_complete(self, location_name):
+            calls.append(location_name)
+
+    manager.register_handler(RecordingHandler())
+    manager.notify_location_complete("First")
+    manager.clear_handlers()
+    manager.notify_location_complete("Second")
+
+    assert calls == ["First"]
+
+
+def test_progress_manager_single_handler_uses_fixed_calling_convention():
+    manager = ProgressManager()
+    calls = []
+
+    class RenamedParamsHandler:
+        def __init__(self, name):
+            self.name = name
+
+        def on_location_start(self, place, index, count, years=1):
+            calls.append((self.name, place, years))
+
+        def on_stage_progress(self, stage, item, current, total, extra=None):
+            calls.append((self.name, stage, extra))
+
+    manager.register_handler(RenamedParamsHandler("only"))
+    manager.notify_location_start("Test City", 1, 1, total_years=3)
+    manager.notify_stage_progress("Plot output", "batch 1", 1, 2, detail="page")
+    assert calls == [("only", "Test City", 3), ("only", "Plot output", "page")]
+
+    manager.register_handler(RenamedParamsHandler("second"))
+    calls.clear()
+    manager.notify_location_start("Test City", 1, 1, total_years=3)
+    assert calls == [("only", "Test City", 3), ("second", "Test City", 3)]
+
+    manager.clear_handlers()
+    calls.clear()
+    manager.notify_location_start("Test City", 1, 1, total_years=3)
+    assert calls == []
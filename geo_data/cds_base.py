@@ -31,7 +31,7 @@ except ImportError:
     _tf = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
     """
     Represents a geographic location with a name, latitude, longitude, and timezone.
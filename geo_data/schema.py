@@ -9,6 +9,11 @@ import yaml
 
 SCHEMA_REGISTRY_FILE = Path(__file__).resolve().parent / 'schema.yaml'
 
+try:
+    _SAFE_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _SAFE_LOADER = yaml.SafeLoader
+
 
 @dataclass(frozen=True)
 class Schema:
@@ -27,7 +32,7 @@ class Schema:
     def _read_registry_yaml(schema_file: Path) -> dict:
         """Read raw schema registry YAML content as a mapping."""
         with open(schema_file, 'r') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SAFE_LOADER) or {}
 
     @staticmethod
     def _validate_schema_definition(version_key: str, schema_def: dict, current_key: str) -> None:
@@ -71,6 +71,16 @@ def test_location_timezone_explicit_override():
     assert loc.tz == "America/New_York"
 
 
+def test_location_is_slotted_and_frozen():
+    import dataclasses
+
+    loc = Location(name="London", lat=51.5074, lon=-0.1278)
+    assert not hasattr(loc, "__dict__")
+    assert {loc: 1}[Location(name="London", lat=51.5074, lon=-0.1278, tz="Europe/London")] == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        loc.tz = "UTC"
+
+
 def test_cds_month_range():
     cds = DummyCDS(cache_dir=Path("/tmp/era5_cache"))
     months = list(cds._month_range(pd.Timestamp('2025-01-01').date(), pd.Timestamp('2025-03-01').date()))
@@ -8,6 +8,7 @@ handling batching, grid layouts, and display logic.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -32,6 +33,11 @@ class PlotRunContext:
     t_max_c: float
 
 
+def _render_batch_subplot(orchestrator_kwargs: dict, batch_kwargs: dict) -> str:
+    """Render one batch page in a worker process and return the saved file path."""
+    return PlotOrchestrator(**orchestrator_kwargs).create_batch_subplot(**batch_kwargs)
+
+
 class PlotOrchestrator:
     """Encapsulate measure-aware plotting configuration and rendering helpers."""
 
@@ -327,8 +333,14 @@ class PlotOrchestrator:
         run_ctx: PlotRunContext,
         grid: tuple[int, int] | None,
         list_name: str | None = None,
+        max_workers: int = 1,
     ) -> list[str]:
-        """Create all main subplot plots, split into batches when required."""
+        """
+        Create all main subplot plots, split into batches when required.
+
+        With ``max_workers > 1`` and more than one batch, each batch page is rendered
+        in its own process; files are returned in batch order either way.
+        """
         num_places = len(place_list)
         num_rows, num_cols, max_places_per_image = self.calculate_grid_dimensions(num_places, grid)
         num_batches = (num_places + max_places_per_image - 1) // max_places_per_image
@@ -337,21 +349,13 @@ class PlotOrchestrator:
         if not grid:
             max_rows, max_cols = self.config_service.load_grid_settings()
 
-        batch_plot_files = []
+        batch_jobs = []
         for batch_idx in range(num_batches):
             start_idx = batch_idx * max_places_per_image
             end_idx = min(start_idx + max_places_per_image, num_places)
             batch_places = place_list[start_idx:end_idx]
             batch_size = len(batch_places)
 
-            self.progress_mgr.notify_stage_progress(
-                "Plot output",
-                f"batch {batch_idx + 1}",
-                batch_idx + 1,
-                num_batches,
-                detail=f"{batch_size} place(s)",
-            )
-
             batch_place_names = [p.name for p in batch_places]
             df_batch = df_overall[df_overall['place_name'].isin(batch_place_names)]
 
@@ -361,23 +365,58 @@ class PlotOrchestrator:
                 assert max_rows is not None and max_cols is not None
                 batch_rows, batch_cols = calculate_grid_layout(batch_size, max_rows, max_cols)
 
-            plot_file = self.create_batch_subplot(
-                df_batch=df_batch,
-                batch_places=batch_places,
-                batch_idx=batch_idx,
-                num_batches=num_batches,
-                batch_rows=batch_rows,
-                batch_cols=batch_cols,
-                run_ctx=run_ctx,
-                list_name=list_name,
-            )
-            batch_plot_files.append(plot_file)
+            batch_jobs.append({
+                'df_batch': df_batch,
+                'batch_places': batch_places,
+                'batch_idx': batch_idx,
+                'num_batches': num_batches,
+                'batch_rows': batch_rows,
+                'batch_cols': batch_cols,
+                'run_ctx': run_ctx,
+                'list_name': list_name,
+            })
+
+        if max_workers > 1 and num_batches > 1:
+            batch_plot_files = self._render_batches_in_parallel(batch_jobs, max_workers)
+        else:
+            batch_plot_files = []
+            for job in batch_jobs:
+                self._notify_batch_progress(job)
+                batch_plot_files.append(self.create_batch_subplot(**job))
 
         if num_batches:
             self.progress_mgr.notify_stage_complete("Plot output")
 
         return batch_plot_files
 
+    def _notify_batch_progress(self, job: dict) -> None:
+        """Report progress for one batch page."""
+        self.progress_mgr.notify_stage_progress(
+            "Plot output",
+            f"batch {job['batch_idx'] + 1}",
+            job['batch_idx'] + 1,
+            job['num_batches'],
+            detail=f"{len(job['batch_places'])} place(s)",
+        )
+
+    def _render_batches_in_parallel(self, batch_jobs: list[dict], max_workers: int) -> list[str]:
+        """Render batch pages across worker processes, preserving batch order."""
+        orchestrator_kwargs = {
+            'config': self.config,
+            'settings': self.settings,
+            'measure': self.measure,
+            'colour_mode': self.colour_mode,
+            'colormap_name': self.colormap_name,
+        }
+        logger.info(f"Rendering {len(batch_jobs)} batch plots with {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(batch_jobs))) as executor:
+            futures = [executor.submit(_render_batch_subplot, orchestrator_kwargs, job) for job in batch_jobs]
+            batch_plot_files = []
+            for job, future in zip(batch_jobs, futures):
+                batch_plot_files.append(future.result())
+                self._notify_batch_progress(job)
+        return batch_plot_files
+
 
 def plot_all(
     df_overall: pd.DataFrame,
@@ -393,7 +432,8 @@ def plot_all(
     list_name: str | None = None,
     measure: str = "noon_temperature",
     colour_mode: str | None = None,
-    colormap_name: str = "turbo"
+    colormap_name: str = "turbo",
+    max_workers: int = 1,
 ) -> None:
     """
     Generate all plots (overall subplot and individual plots) for the temperature data.
@@ -413,6 +453,7 @@ def plot_all(
         measure: Data measure key (e.g., "noon_temperature", "daily_precipitation").
         colour_mode: Colour mapping mode ('y_value', 'colour_value', or 'year').
         colormap_name: Matplotlib colormap name.
+        max_workers: Worker processes for rendering batch pages (1 renders serially).
     """
     orchestrator = PlotOrchestrator(
         config=config,
@@ -470,6 +511,7 @@ def plot_all(
             run_ctx=run_ctx,
             grid=grid,
             list_name=list_name,
+            max_workers=max_workers,
         )
 
         # Show plots if requested
@@ -1,6 +1,7 @@
 """
 Tests for orchestrator module (plot coordination and batching).
 """
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import pandas as pd
@@ -591,6 +592,53 @@ def test_create_main_plots_multiple_batches(mock_create_batch, tmp_path):
     assert mock_create_batch.call_count == 2
 
 
+def test_create_main_plots_worker_processes_match_serial_output(tmp_path):
+    """Batch pages rendered in worker processes match serial rendering, in batch order."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "\n".join([
+            "plot_text:",
+            "  overall_title: '{measure_label} ({start_year}-{end_year})'",
+            "  overall_title_with_batch: '{measure_label} ({start_year}-{end_year}) - Part {batch}/{total_batches}'",
+            "  subplot_filename: '{list_name}_{measure_key}_{start_year}_{end_year}.png'",
+            "  subplot_filename_with_batch: '{list_name}_{measure_key}_{start_year}_{end_year}_part{batch}of{total_batches}.png'",
+            "  single_plot_title: '{location} {measure_label} ({start_year}-{end_year})'",
+            "  single_plot_filename: '{location}_{measure_key}_{start_year}_{end_year}.png'",
+            "  credit: 'Credit'",
+            "  single_plot_credit: 'Credit'",
+            "  data_source: 'Data from: ERA5 via CDS'",
+            "plotting:",
+            "  measures:",
+            "    noon_temperature:",
+            "      label: Mid-Day Temperature",
+            "      unit: °C",
+            "      y_value_column: temp_C",
+            "      range_text: '{min_temp_c:.1f}°C to {max_temp_c:.1f}°C'",
+        ])
+    )
+    names = ['A', 'B', 'C']
+    df = pd.DataFrame({
+        'place_name': [name for name in names for _ in range(3)],
+        'date': ['2024-01-01', '2024-04-01', '2024-07-01'] * 3,
+        'temp_C': [5.0, 12.0, 20.0, 8.0, 15.0, 24.0, 2.0, 9.0, 17.0],
+    })
+    places = [Location(name=name, lat=40.0 + i, lon=-73.0, tz="America/New_York") for i, name in enumerate(names)]
+    orchestrator = PlotOrchestrator(config=config_file, settings=Path("geo_plot/settings.yaml"))
+
+    outputs = {}
+    for workers in (1, 2):
+        run_ctx = PlotRunContext(start_year=2024, end_year=2024, out_dir=tmp_path / f"workers{workers}", t_min_c=0.0, t_max_c=25.0)
+        with patch('geo_plot.orchestrator.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool:
+            files = orchestrator.create_main_plots(df_overall=df, place_list=places, run_ctx=run_ctx, grid=(1, 1), max_workers=workers)
+        assert pool.called == (workers > 1)
+        outputs[workers] = files
+
+    assert [Path(f).name for f in outputs[2]] == [Path(f).name for f in outputs[1]]
+    assert [Path(f).parent for f in outputs[2]] == [tmp_path / "workers2"] * 3
+    for serial_file, parallel_file in zip(outputs[1], outputs[2]):
+        assert Path(parallel_file).read_bytes() == Path(serial_file).read_bytes()
+
+
 @patch('geo_plot.orchestrator.Visualizer')
 @patch.object(PlotOrchestrator, 'create_individual_plot')
 @patch.object(PlotOrchestrator, 'create_main_plots')
@@ -1,8 +1,12 @@
 # Test Visualizer class and related data handling
+import os
+import numpy as np
 import pytest
 import pandas as pd
 import matplotlib
+import matplotlib.image
 matplotlib.use('Agg')  # Use non-interactive backend for tests
+from matplotlib.collections import LineCollection, PathCollection  # noqa: E402
 from geo_plot.visualizer import Visualizer  # noqa: E402
 
 
@@ -10,6 +14,8 @@ def test_temp_c_to_f():
     assert Visualizer.temp_c_to_f(0) == 32.0
     assert Visualizer.temp_c_to_f(100) == 212.0
     assert Visualizer.temp_c_to_f(-40) == -40.0
+    assert list(Visualizer.temp_c_to_f(np.array([0.0, 100.0]))) == [32.0, 212.0]
+    assert list(Visualizer.temp_c_to_f([-40.0, 37.0])) == [-40.0, 98.6]
 
 
 def test_add_data_fields():
@@ -100,6 +106,21 @@ def test_plot_polar_basic(tmp_path):
     assert output_file.exists()
 
 
+def test_plot_polar_save_only_does_not_register_pyplot_figures(tmp_path):
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=10),
+        'temp_C': list(range(10))
+    })
+    vis = Visualizer(df)
+    output_file = tmp_path / "save_only.png"
+    before = matplotlib.pyplot.get_fignums()
+
+    vis.plot_polar(title="Save Only", save_file=str(output_file), show_plot=False)
+
+    assert output_file.exists()
+    assert matplotlib.pyplot.get_fignums() == before
+
+
 def test_plot_polar_with_range(tmp_path):
     """Test plot_polar with varying temperatures."""
     df = pd.DataFrame({
@@ -441,7 +462,9 @@ def test_visualizer_limits_y_circles_with_max_y_steps():
     ax = fig.add_subplot(111, polar=True)
     vis.create_polar_plot(ax, vis.df)
 
-    assert len(ax.lines) <= 4
+    rings = [coll for coll in ax.collections if isinstance(coll, LineCollection)]
+    assert len(rings) == 1
+    assert 0 < len(rings[0].get_segments()) <= 4
     matplotlib.pyplot.close(fig)
 
 
@@ -483,7 +506,7 @@ def test_plot_polar_subplots_uses_subplot_title_template(tmp_path, monkeypatch):
 
     captured_titles: list[str] = []
 
-    def _capture_subplot_title(self, ax, df, cbar=False, title="", num_rows=1):
+    def _capture_subplot_title(self, ax, df, cbar=False, title="", num_rows=1, range_bounds=None, bbox=None, point_colours=None):
         captured_titles.append(title)
 
     monkeypatch.setattr(Visualizer, "subplot_polar", _capture_subplot_title)
@@ -500,3 +523,432 @@ def test_plot_polar_subplots_uses_subplot_title_template(tmp_path, monkeypatch):
 
     assert output_file.exists()
     assert captured_titles == ['City A', 'City B']
+
+
+def test_load_settings_from_yaml_reuses_parsed_settings_until_file_changes(tmp_path):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("polar_single:\n  page:\n    dpi: 100\n")
+
+    first = Visualizer.load_settings_from_yaml(settings_file)
+    second = Visualizer.load_settings_from_yaml(str(settings_file))
+    assert first is second
+    assert first['polar_single']['page']['dpi'] == 100
+    with pytest.raises(TypeError):
+        first['polar_single'] = {}
+
+    settings_file.write_text("polar_single:\n  page:\n    dpi: 200\n")
+    stat = settings_file.stat()
+    os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = Visualizer.load_settings_from_yaml(settings_file)
+    assert reloaded['polar_single']['page']['dpi'] == 200
+
+
+def test_load_settings_from_yaml_reloads_same_mtime_edit_with_new_size(tmp_path):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("polar_single:\n  page:\n    dpi: 100\n")
+    stat = settings_file.stat()
+    assert Visualizer.load_settings_from_yaml(settings_file)['polar_single']['page']['dpi'] == 100
+
+    settings_file.write_text("polar_single:\n  page:\n    dpi: 1200\n")
+    os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert Visualizer.load_settings_from_yaml(settings_file)['polar_single']['page']['dpi'] == 1200
+
+
+def test_plot_polar_subplots_passes_per_place_range_bounds(tmp_path, monkeypatch):
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=4),
+        'temp_C': [10.0, 11.0, 12.0, 13.0],
+        'place_name': ['City A', 'City A', 'City B', 'City B'],
+    })
+    vis = Visualizer(df)
+    captured_bounds: list[tuple[float, float]] = []
+
+    def _capture_range_bounds(self, ax, df, cbar=False, title="", num_rows=1, range_bounds=None, bbox=None, point_colours=None):
+        captured_bounds.append(range_bounds)
+
+    monkeypatch.setattr(Visualizer, "subplot_polar", _capture_range_bounds)
+
+    vis.plot_polar_subplots(
+        num_rows=1,
+        num_cols=2,
+        save_file=str(tmp_path / "subplot_bounds.png"),
+        show_plot=False,
+    )
+
+    assert captured_bounds == [(10.0, 11.0), (12.0, 13.0)]
+
+
+def test_visualizer_reuses_colour_norm_for_celsius_colourbar():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=3), 'temp_C': [0.0, 10.0, 100.0]})
+    vis = Visualizer(df)
+    assert vis._norm_c is vis.norm
+
+    clipped = Visualizer(df, t_min_c=-10.0, t_max_c=40.0)
+    assert clipped._norm_c is not clipped.norm
+    assert (clipped._norm_c.vmin, clipped._norm_c.vmax) == (-10.0, 40.0)
+
+
+def test_create_polar_plot_points_add_single_path_collection():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=5), 'temp_C': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    vis = Visualizer(df)
+    fig = matplotlib.pyplot.figure()
+    ax = fig.add_subplot(111, polar=True)
+
+    vis.create_polar_plot(ax, vis.df)
+
+    points = [coll for coll in ax.collections if isinstance(coll, PathCollection)]
+    assert len(points) == 1
+    assert len(points[0].get_offsets()) == 5
+    assert len(points[0].get_facecolors()) == 5
+    matplotlib.pyplot.close(fig)
+
+
+def test_add_points_renders_like_scatter():
+    rng = np.random.default_rng(0)
+    theta = rng.uniform(0, 2 * np.pi, 500)
+    values = rng.uniform(0, 30, 500)
+    colours = matplotlib.colormaps['turbo'](values / 30)
+
+    def render(draw):
+        fig, ax = matplotlib.pyplot.subplots(subplot_kw={'projection': 'polar'}, figsize=(3, 3), dpi=100)
+        ax.set_ylim(0, 30)
+        draw(ax)
+        fig.canvas.draw()
+        pixels = np.asarray(fig.canvas.buffer_rgba()).copy()
+        matplotlib.pyplot.close(fig)
+        return pixels
+
+    expected = render(lambda ax: ax.scatter(theta, values, c=colours, s=4))
+    actual = render(lambda ax: Visualizer._add_points(ax, theta, values, colours, 4))
+    assert np.array_equal(actual, expected)
+
+
+def test_visualizer_year_bounds_from_unsorted_dates():
+    df = pd.DataFrame({'date': ['2021-06-01', '1965-12-31', '2024-01-01'], 'temp_C': [1.0, 2.0, 3.0]})
+    vis = Visualizer(df)
+    assert (vis.first_year, vis.last_year) == (1965, 2024)
+    assert isinstance(vis.first_year, int)
+
+
+def test_ring_layout_is_cached_across_subplots():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=3), 'temp_C': [0.0, 10.0, 20.0]})
+    vis = Visualizer(df)
+    first = vis._get_ring_layout(10.0)
+    ticks, _, upper_labels, lower_labels = first
+
+    assert vis._get_ring_layout(10.0) is first
+    assert list(ticks) == [0.0, 10.0, 20.0]
+    assert upper_labels == ['0°C', '10°C', '20°C']
+    assert lower_labels == ['32°F', '50°F', '68°F']
+
+
+def test_create_polar_plot_rasterizes_dense_points(monkeypatch):
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=5), 'temp_C': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    vis = Visualizer(df)
+    fig = matplotlib.pyplot.figure()
+    sparse_ax = fig.add_subplot(121, polar=True)
+    vis.create_polar_plot(sparse_ax, vis.df)
+    monkeypatch.setattr(Visualizer, 'RASTERIZE_POINTS_ABOVE', 4)
+    dense_ax = fig.add_subplot(122, polar=True)
+    vis.create_polar_plot(dense_ax, vis.df)
+
+    def points(ax):
+        return next(coll for coll in ax.collections if isinstance(coll, PathCollection))
+
+    assert not points(sparse_ax).get_rasterized()
+    assert points(dense_ax).get_rasterized()
+    matplotlib.pyplot.close(fig)
+
+
+def test_draw_temp_circles_labels_use_configured_font_size():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=3), 'temp_C': [0.0, 10.0, 20.0]})
+    vis = Visualizer(df)
+    fig = matplotlib.pyplot.figure()
+    ax = fig.add_subplot(111, polar=True)
+
+    vis.draw_temp_circles(ax)
+
+    expected_size = vis.all_settings[vis.layout]['figure']['ytick_fontsize']
+    labels = {text.get_text(): text.get_fontsize() for text in ax.texts}
+    assert set(labels) == {'0°C', '10°C', '20°C', '32°F', '50°F', '68°F'}
+    assert all(size == expected_size for size in labels.values())
+    matplotlib.pyplot.close(fig)
+
+
+def test_plot_polar_subplots_saves_full_page_without_tight_bbox(tmp_path):
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=10),
+        'temp_C': list(range(10)),
+        'place_name': ['Test Place'] * 10
+    })
+    vis = Visualizer(df)
+    output_file = tmp_path / "subplots.png"
+
+    vis.plot_polar_subplots(title="Fixed Page", save_file=str(output_file), num_rows=1, num_cols=1, show_plot=False)
+
+    figure_settings = vis.all_settings['polar_subplot']['figure']
+    dpi = vis.all_settings['polar_subplot']['page']['dpi']
+    image = matplotlib.image.imread(output_file)
+    assert image.shape[1] == round(figure_settings['fig_width_in'] * dpi)
+    assert image.shape[0] == round(figure_settings['fig_height_in'] * dpi)
+
+
+def test_point_colours_match_colormap_for_values_and_missing_data():
+    values = [-5.0, 0.0, 2.5, float('nan'), 7.5, 10.0]
+    df = pd.DataFrame({'date': pd.date_range('2020-12-30', periods=6), 'temp_C': values})
+    vis = Visualizer(df, colormap_name='viridis')
+
+    expected = vis.cmap(vis.norm(vis.df['temp_C']))
+    assert (vis.get_point_colours(vis.df) == expected).all()
+
+    year_vis = Visualizer(df, colormap_name='viridis', colour_mode='year')
+    years = pd.to_datetime(year_vis.df['date']).dt.year.astype(float)
+    assert (year_vis.get_point_colours(year_vis.df) == year_vis.year_cmap(year_vis.year_norm(years))).all()
+
+
+def test_load_settings_from_yaml_shares_cache_across_path_spellings(tmp_path, monkeypatch):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("polar_single:\n  page:\n    dpi: 100\n")
+    monkeypatch.chdir(tmp_path)
+
+    absolute = Visualizer.load_settings_from_yaml(str(settings_file))
+    relative = Visualizer.load_settings_from_yaml("settings.yaml")
+
+    assert relative is absolute
+
+
+def test_add_data_fields_angle_matches_day_of_year():
+    df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=366), 'temp_C': [1.0] * 366})
+    vis = Visualizer(df)
+    expected = 2 * np.pi * (vis.df['day_of_year'].to_numpy() - 1) / 365.0
+
+    assert vis.df['angle'].dtype == np.float32
+    assert np.allclose(vis.df['angle'].to_numpy(), expected, atol=1e-6)
+
+
+def test_dual_temperature_colourbars_share_one_mappable():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=2), 'temp_C': [0.0, 20.0]})
+    vis = Visualizer(df)
+    fig = matplotlib.pyplot.figure(figsize=(13.34, 7.5))
+    vis.add_dual_colourbars(fig)
+    fig.canvas.draw()
+
+    colourbar_axes = {ax.get_title(): ax for ax in fig.axes if ax.get_title()}
+    c_ax = colourbar_axes[r'$^\circ\mathrm{C}$']
+    f_ax = colourbar_axes[r'$^\circ\mathrm{F}$']
+    assert c_ax._colorbar.mappable is f_ax._colorbar.mappable
+    low, high = f_ax.get_ylim()
+    f_labels = [tick.label1.get_text() for tick in f_ax.yaxis.get_major_ticks() if low <= tick.get_loc() <= high]
+    assert f_labels == ['35', '40', '45', '50', '55', '60', '65']
+    matplotlib.pyplot.close(fig)
+
+
+def test_add_data_fields_converts_string_dates_once_even_with_precomputed_angles():
+    df = pd.DataFrame({
+        'date': ['2024-01-01', '2025-06-30'],
+        'temp_C': [1.0, 2.0],
+        'day_of_year': [1, 181],
+        'angle': [0.0, 3.1],
+    })
+    vis = Visualizer(df, colour_mode='year')
+
+    assert pd.api.types.is_datetime64_any_dtype(vis.df['date'])
+    assert (vis.first_year, vis.last_year) == (2024, 2025)
+    assert vis.get_point_colours(vis.df).shape == (2, 4)
+
+
+def test_plot_polar_subplots_passes_each_place_sorted_by_day(tmp_path, monkeypatch):
+    df = pd.DataFrame({
+        'date': ['2025-03-01', '2024-01-05', '2025-01-02', '2024-02-01', '2025-01-01'],
+        'temp_C': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'place_name': ['City A', 'City B', 'City A', 'City A', 'City B'],
+    })
+    vis = Visualizer(df)
+    captured: dict[str, list[float]] = {}
+
+    def _capture_frame(self, ax, df, cbar=False, title="", num_rows=1, range_bounds=None, bbox=None, point_colours=None):
+        captured[df['place_name'].iloc[0]] = df['temp_C'].tolist()
+
+    monkeypatch.setattr(Visualizer, "subplot_polar", _capture_frame)
+
+    vis.plot_polar_subplots(num_rows=1, num_cols=2, save_file=str(tmp_path / "sorted.png"), show_plot=False)
+
+    assert captured == {'City A': [3.0, 4.0, 1.0], 'City B': [5.0, 2.0]}
+
+
+def test_settings_manager_reused_per_layout_and_row_count():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=2), 'temp_C': [1.0, 2.0]})
+    vis = Visualizer(df)
+    vis.layout = 'polar_subplot'
+    three_rows = vis._settings_manager(3)
+
+    assert vis._settings_manager(3) is three_rows
+    assert vis._settings_manager(1) is not three_rows
+
+    vis.layout = 'polar_single'
+    assert vis._settings_manager(3).settings is vis.all_settings['polar_single']
+
+
+def test_get_point_colours_depends_only_on_its_argument():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=4), 'temp_C': [0.0, 10.0, 20.0, 30.0]})
+    vis = Visualizer(df)
+    full = vis.get_point_colours(vis.df)
+
+    shifted = vis.df.assign(temp_C=[30.0, 20.0, 10.0, 0.0])
+    assert (vis.get_point_colours(shifted) == full[::-1]).all()
+    assert vis.df.attrs == {}
+
+
+def test_plot_polar_subplots_passes_each_place_its_point_colours(tmp_path, monkeypatch):
+    df = pd.DataFrame({
+        'date': ['2025-03-01', '2024-01-05', '2025-01-02', '2024-02-01', '2025-01-01'],
+        'temp_C': [1.0, 25.0, 3.0, 14.0, 35.0],
+        'place_name': ['City A', 'City B', 'City A', 'City A', 'City B'],
+    })
+    vis = Visualizer(df)
+    captured: dict[str, tuple] = {}
+
+    def _capture_colours(self, ax, df, cbar=False, title="", num_rows=1, range_bounds=None, bbox=None, point_colours=None):
+        captured[df['place_name'].iloc[0]] = (point_colours, self.get_point_colours(df))
+
+    monkeypatch.setattr(Visualizer, "subplot_polar", _capture_colours)
+
+    vis.plot_polar_subplots(num_rows=1, num_cols=2, save_file=str(tmp_path / "colours.png"), show_plot=False)
+
+    assert set(captured) == {'City A', 'City B'}
+    for passed, expected in captured.values():
+        assert (passed == expected).all()
+
+
+def test_create_polar_plot_reorders_passed_colours_with_render_order():
+    df = pd.DataFrame({
+        'date': ['2025-01-02', '2024-01-01', '2025-01-01', '2023-01-02'],
+        'wet_hours_per_day': [4.0, 2.0, 8.0, 1.0],
+        'precip_mm': [3.0, 1.0, 0.5, 2.0],
+    })
+    vis = Visualizer(df, y_value_column='wet_hours_per_day', colour_value_column='precip_mm')
+    fig = matplotlib.pyplot.figure()
+    ax_default = fig.add_subplot(121, polar=True)
+    ax_passed = fig.add_subplot(122, polar=True)
+
+    vis.create_polar_plot(ax_default, vis.df)
+    vis.create_polar_plot(ax_passed, vis.df, point_colours=vis.get_point_colours(vis.df))
+
+    default_points, passed_points = (
+        next(coll for coll in ax.collections if isinstance(coll, PathCollection)) for ax in (ax_default, ax_passed)
+    )
+    assert (default_points.get_facecolors() == passed_points.get_facecolors()).all()
+    matplotlib.pyplot.close(fig)
+
+
+def test_create_polar_plot_uniform_colours_use_single_facecolour():
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=5), 'temp_C': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    vis = Visualizer(df, colour_mode='year')
+    fig = matplotlib.pyplot.figure()
+    ax = fig.add_subplot(111, polar=True)
+
+    vis.create_polar_plot(ax, vis.df)
+
+    points = next(coll for coll in ax.collections if isinstance(coll, PathCollection))
+    assert len(points.get_offsets()) == 5
+    assert len(points.get_facecolors()) == 1
+    matplotlib.pyplot.close(fig)
+
+
+def test_plot_polar_saves_before_showing(tmp_path, monkeypatch):
+    df = pd.DataFrame({'date': pd.date_range('2025-01-01', periods=3), 'temp_C': [1.0, 2.0, 3.0]})
+    vis = Visualizer(df)
+    output_file = tmp_path / "shown.png"
+    saved_when_shown = []
+    monkeypatch.setattr(matplotlib.pyplot, 'show', lambda: saved_when_shown.append(output_file.exists()))
+
+    vis.plot_polar(title="Shown", save_file=str(output_file), show_plot=True)
+
+    assert saved_when_shown == [True]
+
+
+def test_plot_polar_subplots_passes_final_axes_position(tmp_path, monkeypatch):
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=4),
+        'temp_C': [10.0, 11.0, 12.0, 13.0],
+        'place_name': ['City A', 'City A', 'City B', 'City B'],
+    })
+    vis = Visualizer(df)
+    captured: list[tuple] = []
+
+    def _capture_bbox(self, ax, df, cbar=False, title="", num_rows=1, range_bounds=None, bbox=None, point_colours=None):
+        captured.append((bbox.bounds, ax.get_position().bounds))
+
+    monkeypatch.setattr(Visualizer, "subplot_polar", _capture_bbox)
+
+    vis.plot_polar_subplots(
+        num_rows=1,
+        num_cols=2,
+        save_file=str(tmp_path / "subplot_bbox.png"),
+        show_plot=False,
+    )
+
+    assert len(captured) == 2
+    for passed, actual in captured:
+        assert passed == pytest.approx(actual)
+
+
+def test_get_range_bounds_reuses_dataset_bounds_and_skips_nan():
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=4),
+        'temp_C': [10.0, np.nan, 4.0, 13.0],
+    })
+    vis = Visualizer(df)
+
+    assert vis._get_range_bounds(vis.df) is vis._y_bounds
+    assert vis._get_range_bounds(vis.df.iloc[:2]) == (10.0, 10.0)
+    assert vis._get_range_bounds(vis.df) == (4.0, 13.0)
+
+
+def test_show_saved_plots_launches_viewers_without_waiting(monkeypatch):
+    import subprocess
+    import sys
+
+    launched: list[list[str]] = []
+    monkeypatch.setattr(subprocess, "Popen", lambda args: launched.append(list(args)))
+
+    monkeypatch.setattr(sys, "platform", "darwin")
+    Visualizer.show_saved_plots(["a.png", "b.png"])
+    assert launched == [["open", "a.png", "b.png"]]
+
+    launched.clear()
+    monkeypatch.setattr(sys, "platform", "linux")
+    Visualizer.show_saved_plots(["a.png", "b.png"])
+    assert launched == [["xdg-open", "a.png"], ["xdg-open", "b.png"]]
+
+
+def test_show_saved_plots_warns_when_viewer_missing(monkeypatch, caplog):
+    import subprocess
+    import sys
+
+    def _missing_viewer(args):
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(subprocess, "Popen", _missing_viewer)
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    with caplog.at_level("WARNING", logger="geo"):
+        Visualizer.show_saved_plots(["a.png"])
+
+    assert "Could not find system image viewer for a.png" in caplog.text
+
+
+def test_dual_colourbars_add_only_colourbar_axes():
+    df = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=3),
+        'temp_C': [0.0, 10.0, 20.0],
+    })
+    vis = Visualizer(df)
+    fig = matplotlib.figure.Figure()
+
+    vis.add_dual_colourbars(fig)
+
+    assert len(fig.axes) == 2
+    assert all(ax.get_box_aspect() == Visualizer.CBAR_ASPECT for ax in fig.axes)
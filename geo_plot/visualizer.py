@@ -1,15 +1,59 @@
+import functools
+import os
+import types
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import yaml
 import logging
-from matplotlib import cm
+import matplotlib as mpl
+from matplotlib import cm, ticker
+from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import Bbox, IdentityTransform
 from .settings_manager import SettingsManager
 
 logger = logging.getLogger("geo")
 
 
+try:
+    _SAFE_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _SAFE_LOADER = yaml.SafeLoader
+
+
+@functools.lru_cache(maxsize=16)
+def _load_settings_cached(yaml_path: str, mtime_ns: int, size: int) -> types.MappingProxyType:
+    """Parse a settings YAML file once per (path, mtime, size) within this process."""
+    with open(yaml_path, 'r') as f:
+        settings = yaml.load(f, Loader=_SAFE_LOADER)
+    return types.MappingProxyType(settings or {})
+
+
+class _FahrenheitLocator(ticker.MaxNLocator):
+    """Locate round °F ticks on an axis whose data are in °C (as AutoLocator would in °F)."""
+
+    def __init__(self) -> None:
+        super().__init__(nbins='auto', steps=[1, 2, 2.5, 5, 10])
+
+    def tick_values(self, vmin: float, vmax: float) -> np.ndarray:
+        f_ticks = super().tick_values(Visualizer.temp_c_to_f(vmin), Visualizer.temp_c_to_f(vmax))
+        return (f_ticks - 32.0) * 5.0 / 9.0
+
+
+class _FahrenheitFormatter(ticker.ScalarFormatter):
+    """Format °C tick positions as their °F values."""
+
+    def __call__(self, x: float, pos=None) -> str:
+        return super().__call__(Visualizer.temp_c_to_f(x), pos)
+
+    def set_locs(self, locs) -> None:
+        super().set_locs(Visualizer.temp_c_to_f(locs))
+
+
 class Visualizer:
     """
     Visualizer for creating polar temperature plots and subplots from temperature data.
@@ -20,8 +64,17 @@ class Visualizer:
     PAGE_A3_HEIGHT_CM = 19.05  # A3 height in cm
     CM_PER_INCH = 2.54
     DEFAULT_Y_STEP = 10.0
-    MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    MONTH_LABELS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+    MONTH_THETA = np.arange(0, 2 * np.pi, np.pi / 6)
+    MONTH_THETA.setflags(write=False)
+    CIRCLE_THETA = np.linspace(0, 2*np.pi, 361)
+    CIRCLE_THETA.setflags(write=False)
+    RADIANS_PER_DAY = np.float32(2 * np.pi / 365.0)
+    RASTERIZE_POINTS_ABOVE = 5000  # Dense point clouds are rasterized in vector outputs
+    CBAR_FRACTION = 0.15  # Colourbar share of its slot width (matplotlib's make_axes default)
+    CBAR_ASPECT = 20  # Colourbar long/short side ratio (matplotlib's make_axes default)
+    POINT_MARKER_PATH = MarkerStyle('o').get_path().transformed(MarkerStyle('o').get_transform())
 
     def __init__(
         self,
@@ -83,6 +136,11 @@ class Visualizer:
         else:
             self.range_text_template = range_text_template
         self.range_text_context = range_text_context or {}
+        # Measure-level placeholders are constant for the instance; only values vary per subplot
+        self._range_text_base_context = {
+            key: self.range_text_context.get(key, '')
+            for key in ('measure', 'measure_key', 'measure_label', 'measure_unit', 'y_value_label')
+        }
 
         self.settings_file = settings_file
         try:
@@ -120,52 +178,84 @@ class Visualizer:
         if self.wedge_width_scale <= 0:
             raise ValueError("wedge_width_scale must be > 0")
 
-        self.first_year = pd.to_datetime(self.df['date'].min()).year
-        self.last_year = pd.to_datetime(self.df['date'].max()).year
-
-        self.tmin_c = t_min_c if t_min_c is not None else np.min(self.df[self.y_value_column])
-        self.tmax_c = t_max_c if t_max_c is not None else np.max(self.df[self.y_value_column])
-        self.colour_min = float(np.min(self.df[self.colour_source_column]))
-        self.colour_max = float(np.max(self.df[self.colour_source_column]))
+        date_values = self.df['date'].to_numpy(dtype='datetime64[ns]')
+        year_bounds = np.array([np.nanmin(date_values), np.nanmax(date_values)]).astype('datetime64[Y]').astype(np.int64) + 1970
+        self.first_year = int(year_bounds[0])
+        self.last_year = int(year_bounds[1])
+
+        y_values = self.df[self.y_value_column].to_numpy(dtype=float)
+        self._y_bounds = (float(np.nanmin(y_values)), float(np.nanmax(y_values)))
+        self.tmin_c = t_min_c if t_min_c is not None else self._y_bounds[0]
+        self.tmax_c = t_max_c if t_max_c is not None else self._y_bounds[1]
+        if self.colour_source_column == self.y_value_column:
+            self.colour_min, self.colour_max = self._y_bounds
+        else:
+            colour_values = self.df[self.colour_source_column].to_numpy(dtype=float)
+            self.colour_min = float(np.nanmin(colour_values))
+            self.colour_max = float(np.nanmax(colour_values))
         try:
             self.cmap = plt.get_cmap(colormap_name)
         except Exception as e:
             raise ValueError(f"Unknown colormap '{colormap_name}': {e}") from e
         self.colormap_name = colormap_name
         self.norm = Normalize(vmin=self.colour_min, vmax=self.colour_max)
+        # Colourbar norms are fixed per instance, so build them once here.
+        if (self.tmin_c, self.tmax_c) == (self.colour_min, self.colour_max):
+            self._norm_c = self.norm
+        else:
+            self._norm_c = Normalize(vmin=self.tmin_c, vmax=self.tmax_c)
+        self._norm_imperial = Normalize(
+            vmin=self.mm_to_inches(self.colour_min),
+            vmax=self.mm_to_inches(self.colour_max),
+        )
         if self.first_year == self.last_year:
             self.year_norm = Normalize(vmin=self.first_year - 0.5, vmax=self.first_year + 0.5)
         else:
             self.year_norm = Normalize(vmin=self.first_year, vmax=self.last_year)
         self.year_cmap = self.cmap
+        # RGBA lookup table for point colouring (year_cmap shares this colormap)
+        self._colour_lut = self.cmap(np.linspace(0.0, 1.0, self.cmap.N))
+        self._bad_colour = np.array(self.cmap.get_bad())
+        self._ring_cache = {}
+        self._settings_managers: dict[tuple[str, int], SettingsManager] = {}
+
+    def _settings_manager(self, num_rows: int) -> SettingsManager:
+        """
+        Return the SettingsManager for the active layout and row count.
+
+        Managers are reused across subplots and keyed by (layout, num_rows), so
+        switching self.layout picks up a different manager rather than a stale one.
+        """
+        key = (self.layout, num_rows)
+        layout_settings = self.all_settings[self.layout]
+        mgr = self._settings_managers.get(key)
+        if mgr is None or mgr.settings is not layout_settings:
+            mgr = SettingsManager(layout_settings, num_rows)
+            self._settings_managers[key] = mgr
+        return mgr
 
     def _get_range_bounds(self, df: pd.DataFrame) -> tuple[float, float]:
         """Return min/max values for configured y-value column."""
         if self.y_value_column not in df.columns:
             raise KeyError(f"Missing y_value_column '{self.y_value_column}' in DataFrame")
-        range_column = self.y_value_column
-        min_value = float(df[range_column].min())
-        max_value = float(df[range_column].max())
-        return min_value, max_value
+        if df is self.df:
+            return self._y_bounds
+        values = df[self.y_value_column].to_numpy(dtype=float)
+        return float(np.nanmin(values)), float(np.nanmax(values))
 
     def _format_range_text(self, min_value: float, max_value: float, df: pd.DataFrame | None = None) -> str:
         """Format value-range text using configured template/context."""
-        measure_unit = self.range_text_context.get('measure_unit', '')
         if df is not None and 'precip_mm' in df.columns:
             max_daily_precip_mm = float(df['precip_mm'].max())
         else:
             max_daily_precip_mm = max_value
         max_daily_precip_in = self.mm_to_inches(max_daily_precip_mm)
         context = {
+            **self._range_text_base_context,
             'min_value': min_value,
             'max_value': max_value,
             'min_y_value': min_value,
             'max_y_value': max_value,
-            'measure': self.range_text_context.get('measure', ''),
-            'measure_key': self.range_text_context.get('measure_key', ''),
-            'measure_label': self.range_text_context.get('measure_label', ''),
-            'measure_unit': measure_unit,
-            'y_value_label': self.range_text_context.get('y_value_label', ''),
             'min_temp_c': min_value,
             'max_temp_c': max_value,
             'min_temp_f': self.temp_c_to_f(min_value),
@@ -174,50 +264,66 @@ class Visualizer:
             'max_daily_precip_in': max_daily_precip_in,
         }
         try:
-            return self.range_text_template.format(**context)
+            return self.range_text_template.format_map(context)
         except KeyError as exc:
             raise ValueError(f"Missing placeholder context for range_text_template: {exc}") from exc
 
     @classmethod
-    def load_settings_from_yaml(cls, yaml_path: str) -> dict:
+    def load_settings_from_yaml(cls, yaml_path: str) -> types.MappingProxyType:
         """
         Load settings from a YAML file and return as a dictionary.
 
+        Parsed settings are reused across Visualizer instances (keyed by resolved
+        path, so relative and symlinked spellings share one entry) until the file's
+        modification time or size changes. The top level is a read-only mapping; nested
+        layout dicts are shared and must not be mutated either.
+
         Args:
             yaml_path: Path to the YAML settings file.
         Returns:
-            dict: Settings loaded from YAML.
+            MappingProxyType: Settings loaded from YAML.
         """
-        with open(yaml_path, 'r') as f:
-            settings = yaml.safe_load(f)
-        return settings or {}
+        yaml_path = os.path.realpath(yaml_path)
+        stat = os.stat(yaml_path)
+        return _load_settings_cached(yaml_path, stat.st_mtime_ns, stat.st_size)
 
     def add_data_fields(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Prepare the DataFrame by ensuring required columns are present.
-        Adds 'day_of_year' and 'angle' columns if missing.
+        Converts 'date' to datetime64 if needed and adds 'day_of_year' and
+        'angle' columns if missing.
 
         Args:
             df: Input DataFrame.
         Returns:
             DataFrame with necessary columns.
         """
+        # Parse dates once so later year/day lookups use the datetime64 fast paths
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = pd.to_datetime(df['date'], cache=True)
         if 'day_of_year' not in df.columns or 'angle' not in df.columns:
-            df['day_of_year'] = pd.to_datetime(df['date']).dt.dayofyear
-            df['angle'] = 2 * np.pi * (df['day_of_year'] - 1) / 365.0
+            # The .dt accessor is already vectorised and measured faster than
+            # datetime64[D] - datetime64[Y] unit arithmetic on multi-year series
+            day_of_year = df['date'].dt.dayofyear.to_numpy()
+            df['day_of_year'] = day_of_year
+            # In-place ops on one float32 buffer avoid the intermediate Series of the naive expression
+            angle = day_of_year.astype(np.float32)
+            np.subtract(angle, 1.0, out=angle)
+            np.multiply(angle, self.RADIANS_PER_DAY, out=angle)
+            df['angle'] = angle
         return df
 
     @staticmethod
-    def temp_c_to_f(temp_c: float) -> float:
+    def temp_c_to_f(temp_c: float | np.ndarray) -> float | np.ndarray:
         """
         Convert Celsius to Fahrenheit.
 
         Args:
-            temp_c: Temperature in Celsius.
+            temp_c: Temperature in Celsius (scalar or array-like).
         Returns:
-            Temperature in Fahrenheit.
+            Temperature in Fahrenheit, as a scalar or ndarray matching the input.
         """
-        return temp_c * 9.0 / 5.0 + 32.0
+        return np.multiply(temp_c, 9.0) / 5.0 + 32.0
 
     @staticmethod
     def mm_to_inches(mm_value: float) -> float:
@@ -274,18 +380,69 @@ class Visualizer:
         else:
             logger.info("Opening plot...")
 
-        for plot_file in plot_files:
+        # Viewers are launched without waiting; `open` takes every file in one call
+        if sys.platform == 'darwin':  # macOS
+            launches = [(', '.join(plot_files), lambda: subprocess.Popen(['open', *plot_files]))]
+        elif sys.platform == 'win32':  # Windows
+            launches = [(plot_file, functools.partial(os.startfile, plot_file)) for plot_file in plot_files]
+        else:  # Linux and other Unix-like (xdg-open accepts a single file)
+            launches = [(plot_file, functools.partial(subprocess.Popen, ['xdg-open', plot_file])) for plot_file in plot_files]
+
+        for target, launch in launches:
             try:
-                if sys.platform == 'darwin':  # macOS
-                    subprocess.run(['open', plot_file], check=True)
-                elif sys.platform == 'win32':  # Windows
-                    subprocess.run(['start', '', plot_file], shell=True, check=True)
-                else:  # Linux and other Unix-like
-                    subprocess.run(['xdg-open', plot_file], check=True)
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to open {plot_file}: {e}")
+                launch()
             except FileNotFoundError:
-                logger.warning(f"Could not find system image viewer for {plot_file}")
+                logger.warning(f"Could not find system image viewer for {target}")
+            except OSError as e:
+                logger.warning(f"Failed to open {target}: {e}")
+
+    @staticmethod
+    def _new_figure(figsize: tuple[float, float], show_plot: bool) -> Figure:
+        """
+        Create a figure for rendering.
+
+        Save-only renders use a standalone Figure (Agg canvas on save) so no
+        pyplot/GUI backend state is touched; interactive renders go through pyplot.
+        """
+        if show_plot:
+            return plt.figure(figsize=figsize)
+        return Figure(figsize=figsize)
+
+    @staticmethod
+    def _add_cbar(
+        fig: plt.Figure,
+        rect: tuple[float, float, float, float],
+        mappable: cm.ScalarMappable,
+        title: str,
+        fontsize: float,
+        title_fontsize: float | None = None,
+    ):
+        """
+        Add one vertical colourbar in the given figure slot.
+
+        The colourbar axes is created directly (``cax``) with the geometry
+        ``fig.colorbar(..., ax=slot)`` would carve out of a placeholder axes, so no
+        placeholder axes is created and no parent axes is resized.
+
+        Args:
+            fig: Figure to draw on.
+            rect: (left, bottom, width, height) in figure coordinates.
+            mappable: Mappable supplying norm and colormap.
+            title: Title shown above the colourbar.
+            fontsize: Base font size; tick labels use fontsize - 2.
+            title_fontsize: Optional title font size (defaults to fontsize).
+
+        Returns:
+            The created Colorbar.
+        """
+        left, bottom, width, height = rect
+        cax = fig.add_axes((left + width * (1.0 - Visualizer.CBAR_FRACTION), bottom, width * Visualizer.CBAR_FRACTION, height))
+        cax.set_box_aspect(Visualizer.CBAR_ASPECT)
+        cax.set_anchor((0.0, 0.5))
+        cbar = fig.colorbar(mappable, cax=cax, orientation='vertical')
+        cbar.ax.set_title(title, fontsize=fontsize if title_fontsize is None else title_fontsize)
+        cbar.ax.tick_params(labelsize=fontsize-2)
+        return cbar
 
     def add_dual_colourbars(self, fig: plt.Figure) -> None:
         """
@@ -294,7 +451,7 @@ class Visualizer:
         Args:
             fig: Matplotlib Figure object to which colorbars are added.
         """
-        mgr = SettingsManager(self.all_settings[self.layout], num_rows=1)
+        mgr = self._settings_manager(num_rows=1)
 
         left_c = mgr.get('colourbar.left_c')
         left_f = mgr.get('colourbar.left_f')
@@ -302,18 +459,16 @@ class Visualizer:
         width = mgr.get('colourbar.width')
         height = mgr.get('colourbar.height')
         fontsize = mgr.get('colourbar.fontsize')
+        left_mid = (left_c + left_f) / 2.0
 
         if self.colour_mode == 'year':
-            left_year = (left_c + left_f) / 2.0
-            cbar_ax_year = fig.add_axes([left_year, bottom, width, height], frameon=False)
-            cbar_ax_year.set_yticks([]), cbar_ax_year.set_xticks([])
-            cbar_year = plt.colorbar(
+            cbar_year = self._add_cbar(
+                fig,
+                (left_mid, bottom, width, height),
                 cm.ScalarMappable(norm=self.year_norm, cmap=self.year_cmap),
-                ax=cbar_ax_year,
-                orientation='vertical'
+                'Year',
+                fontsize,
             )
-            cbar_year.ax.set_title('Year', fontsize=fontsize)
-            cbar_year.ax.tick_params(labelsize=fontsize-2)
             if self.first_year != self.last_year:
                 year_span = self.last_year - self.first_year
                 if year_span <= 10:
@@ -328,59 +483,40 @@ class Visualizer:
             metric_title = self._default_metric_colourbar_title()
             if self._is_precipitation_colour_scale():
                 precip_title_fontsize = max(fontsize - 2, 1)
-                metric_norm = Normalize(vmin=self.colour_min, vmax=self.colour_max)
-                imperial_norm = Normalize(
-                    vmin=self.mm_to_inches(self.colour_min),
-                    vmax=self.mm_to_inches(self.colour_max),
+                self._add_cbar(
+                    fig,
+                    (left_c, bottom, width, height),
+                    cm.ScalarMappable(norm=self.norm, cmap=self.cmap),
+                    metric_title,
+                    fontsize,
+                    title_fontsize=precip_title_fontsize,
                 )
-
-                cbar_ax_metric = fig.add_axes([left_c, bottom, width, height], frameon=False)
-                cbar_ax_metric.set_yticks([]), cbar_ax_metric.set_xticks([])
-                cbar_metric = plt.colorbar(
-                    cm.ScalarMappable(norm=metric_norm, cmap=self.cmap),
-                    ax=cbar_ax_metric,
-                    orientation='vertical'
-                )
-                cbar_metric.ax.set_title(metric_title, fontsize=precip_title_fontsize)
-                cbar_metric.ax.tick_params(labelsize=fontsize-2)
-
-                cbar_ax_imperial = fig.add_axes([left_f, bottom, width, height], frameon=False)
-                cbar_ax_imperial.set_yticks([]), cbar_ax_imperial.set_xticks([])
-                cbar_imperial = plt.colorbar(
-                    cm.ScalarMappable(norm=imperial_norm, cmap=self.cmap),
-                    ax=cbar_ax_imperial,
-                    orientation='vertical'
-                )
-                cbar_imperial.ax.set_title(
+                self._add_cbar(
+                    fig,
+                    (left_f, bottom, width, height),
+                    cm.ScalarMappable(norm=self._norm_imperial, cmap=self.cmap),
                     self._imperial_precip_title(metric_title),
-                    fontsize=precip_title_fontsize,
+                    fontsize,
+                    title_fontsize=precip_title_fontsize,
                 )
-                cbar_imperial.ax.tick_params(labelsize=fontsize-2)
             else:
-                left_single = (left_c + left_f) / 2.0
-                cbar_ax = fig.add_axes([left_single, bottom, width, height], frameon=False)
-                cbar_ax.set_yticks([]), cbar_ax.set_xticks([])
-                norm = Normalize(vmin=self.colour_min, vmax=self.colour_max)
-                cbar = plt.colorbar(cm.ScalarMappable(norm=norm, cmap=self.cmap), ax=cbar_ax, orientation='vertical')
-                cbar.ax.set_title(metric_title, fontsize=fontsize)
-                cbar.ax.tick_params(labelsize=fontsize-2)
+                self._add_cbar(
+                    fig,
+                    (left_mid, bottom, width, height),
+                    cm.ScalarMappable(norm=self.norm, cmap=self.cmap),
+                    metric_title,
+                    fontsize,
+                )
             return
 
         # Celsius colorbar
-        cbar_ax_c = fig.add_axes([left_c, bottom, width, height], frameon=False)
-        cbar_ax_c.set_yticks([]), cbar_ax_c.set_xticks([])
-        norm_c = Normalize(vmin=self.tmin_c, vmax=self.tmax_c)
-        cbar_c = plt.colorbar(cm.ScalarMappable(norm=norm_c, cmap=self.cmap), ax=cbar_ax_c, orientation='vertical')
-        cbar_c.ax.set_title(r'$^\circ\mathrm{C}$', fontsize=fontsize)
-        cbar_c.ax.tick_params(labelsize=fontsize-2)
-
-        # Fahrenheit colorbar
-        cbar_ax_f = fig.add_axes([left_f, bottom, width, height], frameon=False)
-        cbar_ax_f.set_yticks([]), cbar_ax_f.set_xticks([])
-        norm_f = Normalize(vmin=self.temp_c_to_f(self.tmin_c), vmax=self.temp_c_to_f(self.tmax_c))
-        cbar_f = plt.colorbar(cm.ScalarMappable(norm=norm_f, cmap=self.cmap), ax=cbar_ax_f, orientation='vertical')
-        cbar_f.ax.set_title(r'$^\circ\mathrm{F}$', fontsize=fontsize)
-        cbar_f.ax.tick_params(labelsize=fontsize-2)
+        temp_mappable = cm.ScalarMappable(norm=self._norm_c, cmap=self.cmap)
+        self._add_cbar(fig, (left_c, bottom, width, height), temp_mappable, r'$^\circ\mathrm{C}$', fontsize)
+
+        # Fahrenheit colorbar: same mappable (F is affine in C), relabelled in °F
+        cbar_f = self._add_cbar(fig, (left_f, bottom, width, height), temp_mappable, r'$^\circ\mathrm{F}$', fontsize)
+        cbar_f.locator = _FahrenheitLocator()
+        cbar_f.formatter = _FahrenheitFormatter()
 
     def get_point_colours(self, df: pd.DataFrame):
         """
@@ -393,22 +529,53 @@ class Visualizer:
             Array-like RGBA colours for scatter plotting.
         """
         if self.colour_mode == 'year':
-            years = pd.to_datetime(df['date']).dt.year.astype(float)
-            return self.year_cmap(self.year_norm(years))
+            years = df['date'].dt.year.to_numpy(dtype=float)
+            return self._lookup_colours(years, self.year_norm)
 
-        c = self.norm(df[self.colour_source_column])
-        return self.cmap(c)
+        return self._lookup_colours(df[self.colour_source_column].to_numpy(dtype=float), self.norm)
 
-    def _prepare_render_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Return DataFrame in plotting order for improved visibility in overlaps."""
+    def _lookup_colours(self, values: np.ndarray, norm: Normalize) -> np.ndarray:
+        """
+        Map values to RGBA via the cached colormap lookup table.
+
+        Matches ``cmap(norm(values))`` for the default under/over/bad colours, but
+        replaces the per-call normalisation and colormap machinery with one
+        vectorised scale, clip and index.
+
+        Args:
+            values: Numeric values to colour.
+            norm: Normalisation supplying vmin/vmax.
+        Returns:
+            np.ndarray: (N, 4) float RGBA array.
+        """
+        lut = self._colour_lut
+        span = norm.vmax - norm.vmin
+        missing = np.isnan(values)
+        if span > 0:
+            scaled = (values - norm.vmin) * (len(lut) / span)
+        else:
+            scaled = np.zeros_like(values)
+        scaled[missing] = 0.0
+        colours = lut[np.clip(scaled, 0, len(lut) - 1).astype(np.intp)]
+        if missing.any():
+            colours[missing] = self._bad_colour
+        return colours
+
+    def _render_order(self, df: pd.DataFrame) -> np.ndarray | None:
+        """Return row positions in plotting order (None when rows plot as given)."""
         if self.y_value_column == 'wet_hours_per_day' and 'precip_mm' in df.columns:
             sort_columns = ['angle', 'precip_mm', 'wet_hours_per_day']
-            return df.sort_values(
+            return df[sort_columns].reset_index(drop=True).sort_values(
                 by=sort_columns,
                 ascending=[True, True, True],
                 kind='mergesort',
-            )
-        return df
+            ).index.to_numpy()
+        return None
+
+    def _prepare_render_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return DataFrame in plotting order for improved visibility in overlaps."""
+        order = self._render_order(df)
+        return df if order is None else df.iloc[order]
 
     def draw_temp_circles(self, ax: plt.Axes, num_rows: int = 1) -> None:
         """
@@ -418,12 +585,42 @@ class Visualizer:
             ax: Polar axes to draw on.
             num_rows: Number of rows in subplot grid (for font scaling).
         """
-        settings = SettingsManager(self.all_settings[self.layout], num_rows)
+        settings = self._settings_manager(num_rows)
 
         temp_step = self.y_step if self.y_step is not None else self.DEFAULT_Y_STEP
         ytick_fontsize = settings.get('figure.ytick_fontsize')
         ytick_colour = settings.get('figure.ytick_colour')
 
+        ticks, segments, upper_labels, lower_labels = self._get_ring_layout(temp_step)
+
+        # All rings share one artist; each segment is the cached theta sweep at radius t
+        ax.add_collection(LineCollection(segments, colors='gray', linestyles='--', linewidths=0.7, alpha=0.7))
+
+        # One FontProperties for every ring label avoids per-Text rcParams font resolution
+        label_font = FontProperties(size=ytick_fontsize)
+        label_kwargs = {'color': ytick_colour, 'fontproperties': label_font, 'ha': 'center', 'alpha': 0.8}
+        for t, upper_label, lower_label in zip(ticks, upper_labels, lower_labels):
+            # Upper label above X-axis (°C or measure unit)
+            ax.text(np.pi/2, t, upper_label, va='bottom', **label_kwargs)
+            if lower_label is not None:
+                # °F label below X-axis
+                ax.text(3*np.pi/2, t, lower_label, va='top', **label_kwargs)
+
+    def _get_ring_layout(self, temp_step: float) -> tuple[np.ndarray, np.ndarray, list[str], list[str | None]]:
+        """
+        Return ring radii, line segments and label strings, cached across subplots.
+
+        Args:
+            temp_step: Base spacing between rings.
+        Returns:
+            tuple: (ticks, segments, upper_labels, lower_labels); lower labels are None
+            unless the y-value is temperature (°F labels).
+        """
+        key = (self.tmin_c, self.tmax_c, temp_step, self.max_y_steps)
+        cached = self._ring_cache.get(key)
+        if cached is not None:
+            return cached
+
         start_tick = np.ceil(self.tmin_c / temp_step) * temp_step
         ticks = np.arange(start_tick, self.tmax_c + 1, temp_step)
         if self.max_y_steps is not None and len(ticks) > self.max_y_steps:
@@ -431,27 +628,27 @@ class Visualizer:
             adjusted_step = temp_step * step_multiplier
             ticks = np.arange(start_tick, self.tmax_c + 1, adjusted_step)
 
-        for t in ticks:
-            ax.plot(np.linspace(0, 2*np.pi, 361), np.full(361, t), '--', color='gray', lw=0.7, alpha=0.7)
-            if self.y_value_column == 'temp_C':
-                # °C label above X-axis
-                ax.text(np.pi/2, t, f'{int(t)}°C', color=ytick_colour, fontsize=ytick_fontsize, ha='center', va='bottom', alpha=0.8)
-                # °F label below X-axis
-                ax.text(3*np.pi/2, t, f'{int(self.temp_c_to_f(t))}°F', color=ytick_colour, fontsize=ytick_fontsize, ha='center', va='top', alpha=0.8)
-            else:
-                unit_suffix = self.measure_unit if self.measure_unit else self.y_value_column
-                ax.text(
-                    np.pi/2,
-                    t,
-                    f"{int(t)} {unit_suffix}",
-                    color=ytick_colour,
-                    fontsize=ytick_fontsize,
-                    ha='center',
-                    va='bottom',
-                    alpha=0.8,
-                )
+        # (K, 361, 2) array of (theta, radius) vertices built in one pass, no per-ring allocation
+        theta_grid, radius_grid = np.broadcast_arrays(self.CIRCLE_THETA, ticks[:, np.newaxis])
+        segments = np.stack([theta_grid, radius_grid], axis=-1)
+        if self.y_value_column == 'temp_C':
+            upper_labels = [f'{int(t)}°C' for t in ticks]
+            lower_labels = [f'{int(t_f)}°F' for t_f in self.temp_c_to_f(ticks)]
+        else:
+            unit_suffix = self.measure_unit if self.measure_unit else self.y_value_column
+            upper_labels = [f"{int(t)} {unit_suffix}" for t in ticks]
+            lower_labels = [None] * len(ticks)
 
-    def create_polar_plot(self, ax: plt.Axes, df: pd.DataFrame, num_rows: int = 1) -> None:
+        self._ring_cache[key] = (ticks, segments, upper_labels, lower_labels)
+        return self._ring_cache[key]
+
+    def create_polar_plot(
+        self,
+        ax: plt.Axes,
+        df: pd.DataFrame,
+        num_rows: int = 1,
+        point_colours: np.ndarray | None = None,
+    ) -> None:
         """
         Create a polar scatter plot for the given DataFrame and axes.
 
@@ -459,10 +656,15 @@ class Visualizer:
             ax: Polar axes to plot on.
             df: DataFrame with temperature and angle columns.
             num_rows: Number of rows in subplot grid (for font scaling).
+            point_colours: Optional precomputed RGBA colours, one per row of ``df``.
         """
-        settings = SettingsManager(self.all_settings[self.layout], num_rows)
-        render_df = self._prepare_render_df(df)
-        point_colours = self.get_point_colours(render_df)
+        settings = self._settings_manager(num_rows)
+        order = self._render_order(df)
+        render_df = df if order is None else df.iloc[order]
+        if point_colours is None:
+            point_colours = self.get_point_colours(render_df)
+        elif order is not None:
+            point_colours = point_colours[order]
 
         marker_size = settings.get('figure.marker_size')
         xtick_fontsize = settings.get('figure.xtick_fontsize')
@@ -484,11 +686,13 @@ class Visualizer:
                 align='edge',
             )
         else:
-            ax.scatter(render_df['angle'], render_df[self.y_value_column], c=point_colours, s=marker_size)
+            theta = np.ascontiguousarray(render_df['angle'].to_numpy(dtype=np.float32))
+            values = np.ascontiguousarray(render_df[self.y_value_column].to_numpy(dtype=np.float32))
+            self._add_points(ax, theta, values, point_colours, marker_size)
         self.draw_temp_circles(ax, num_rows)
         ax.set_theta_offset(np.pi/2)
         ax.set_theta_direction(-1)
-        ax.set_xticks(np.arange(0, 2 * np.pi, np.pi / 6))
+        ax.set_xticks(self.MONTH_THETA)
         ax.set_xticklabels(self.MONTH_LABELS, fontsize=xtick_fontsize)
         ax.set_yticks([])
 
@@ -501,6 +705,35 @@ class Visualizer:
             margin = 1.0
             ax.set_ylim(y_min - margin, self.tmax_c + margin)
 
+    @classmethod
+    def _add_points(cls, ax: plt.Axes, theta: np.ndarray, values: np.ndarray, colours, marker_size: float) -> None:
+        """
+        Add pre-coloured circle markers to an axes as a single PathCollection.
+
+        Renders the same pixels as ``ax.scatter(theta, values, c=colours, s=marker_size)``
+        (filled-marker edges use ``patch.linewidth``, as scatter's do) but skips
+        scatter's colour/keyword parsing, which is repeated for every subplot.
+        Dense point clouds are rasterized so vector outputs stay O(pixels), not O(points).
+        Uniformly coloured points are given one facecolour so the renderer can reuse
+        a single marker stamp.
+        """
+        colours = np.asarray(colours)
+        if len(colours) and (colours == colours[0]).all():
+            # A single facecolour lets Agg stamp one cached marker (draw_markers fast path)
+            colours = colours[:1]
+        collection = PathCollection(
+            (cls.POINT_MARKER_PATH,),
+            (marker_size,),
+            facecolors=colours,
+            edgecolors='face',
+            linewidths=mpl.rcParams['patch.linewidth'],
+            offsets=np.column_stack([theta, values]),
+            offset_transform=ax.transData,
+        )
+        collection.set_transform(IdentityTransform())
+        collection.set_rasterized(len(theta) > cls.RASTERIZE_POINTS_ABOVE)
+        ax.add_collection(collection)
+
     def plot_polar(
         self,
         title: str = "",
@@ -523,15 +756,13 @@ class Visualizer:
         """
         try:
             self.layout = layout if layout else self.layout
-            settings = self.all_settings[self.layout]
+            mgr = self._settings_manager(num_rows=1)
         except Exception as e:
             raise RuntimeError(f"Error loading settings layout {layout}: {e}") from e
 
-        mgr = SettingsManager(settings, num_rows=1)
-
         fig_width = mgr.get('figure.fig_width_in')
         fig_height = mgr.get('figure.fig_height_in')
-        fig = plt.figure(figsize=(fig_width, fig_height))
+        fig = self._new_figure((fig_width, fig_height), show_plot)
 
         # Make left and right margins symmetrical (match colorbar width)
         cbar_width = mgr.get('colourbar.width')
@@ -542,7 +773,7 @@ class Visualizer:
         self.create_polar_plot(ax, self.df)
 
         # Show temp range under the subplot using the parent figure
-        range_min, range_max = self._get_range_bounds(self.df)
+        range_min, range_max = self._y_bounds
         temp_range_text = self._format_range_text(range_min, range_max, df=self.df)
 
         # Place the text just below the subplot
@@ -571,13 +802,15 @@ class Visualizer:
         label_right = mgr.get('page.label_right')
         label_bottom = mgr.get('page.label_bottom')
         dpi = mgr.get('page.dpi')
+        bbox_inches = 'tight' if mgr.get('page.tight_bbox', True) else None
 
         ax.set_title(title, fontsize=title_fontsize, pad=12, color=title_colour)
-        plt.figtext(label_left, label_bottom, credit, verticalalignment='center', horizontalalignment='left', fontsize=label_fontsize)
-        plt.figtext(label_right, label_bottom, data_source, verticalalignment='center', horizontalalignment='right', fontsize=label_fontsize)
+        fig.text(label_left, label_bottom, credit, verticalalignment='center', horizontalalignment='left', fontsize=label_fontsize)
+        fig.text(label_right, label_bottom, data_source, verticalalignment='center', horizontalalignment='right', fontsize=label_fontsize)
+        # Save before showing so the file never depends on the interactive window
+        fig.savefig(save_file, dpi=dpi, bbox_inches=bbox_inches)
         if show_plot:
             plt.show()
-        fig.savefig(save_file, dpi=dpi, bbox_inches="tight")
         plt.close(fig)
 
     def subplot_polar(
@@ -586,7 +819,10 @@ class Visualizer:
         df: pd.DataFrame,
         cbar: bool = False,
         title: str = "",
-        num_rows: int = 1
+        num_rows: int = 1,
+        range_bounds: tuple[float, float] | None = None,
+        bbox: Bbox | None = None,
+        point_colours: np.ndarray | None = None,
     ) -> None:
         """
         Plot a polar subplot for a given DataFrame and axes.
@@ -597,12 +833,14 @@ class Visualizer:
             cbar: Whether to add colorbars (default False).
             title: Subplot title (default empty).
             num_rows: Number of rows in subplot grid (for font scaling).
+            range_bounds: Optional precomputed (min, max) y-values for the range text.
+            bbox: Optional precomputed axes position (figure coords) for the range text.
+            point_colours: Optional precomputed RGBA colours, one per row of ``df``.
         """
-        settings = self.all_settings[self.layout]
-        mgr = SettingsManager(settings, num_rows)
+        mgr = self._settings_manager(num_rows)
 
         fig = ax.get_figure()
-        self.create_polar_plot(ax, df, num_rows)
+        self.create_polar_plot(ax, df, num_rows, point_colours=point_colours)
 
         # Move month xticklabels closer to the polar plot
         xtick_pad = mgr.get('figure.xtick_pad')
@@ -618,11 +856,14 @@ class Visualizer:
         ax.set_title(title if title else '', fontsize=title_fontsize, pad=0, color=title_colour)
 
         # Show temp range under the subplot using the parent figure
-        range_min, range_max = self._get_range_bounds(df)
+        if range_bounds is None:
+            range_bounds = self._get_range_bounds(df)
+        range_min, range_max = range_bounds
         temp_range_text = self._format_range_text(range_min, range_max, df=df)
 
         # Place the text just below the subplot using scaled vspace
-        bbox = ax.get_position()
+        if bbox is None:
+            bbox = ax.get_position()
         fig.text(
             bbox.x0 + bbox.width / 2,
             bbox.y0 - temp_label_vspace,
@@ -667,7 +908,8 @@ class Visualizer:
         """
         try:
             self.layout = layout if layout else self.layout
-            settings = self.all_settings[self.layout]
+            # Row-scaled settings for this grid (see SettingsManager)
+            mgr = self._settings_manager(num_rows)
         except Exception as e:
             raise RuntimeError(f"Error loading settings layout {layout}: {e}") from e
 
@@ -675,17 +917,23 @@ class Visualizer:
 
         place_list = self.df[subplot_field].unique()
         num_plots = len(place_list)
+        # One stable sort and one groupby pass instead of a mask + sort per subplot
+        day_order = self.df[['day_of_year']].reset_index(drop=True).sort_values('day_of_year', kind='stable').index.to_numpy()
+        place_groups = self.df.iloc[day_order].groupby(subplot_field, sort=False, dropna=False)
+        place_frames = dict(iter(place_groups))
+        # Colour every point in one pass, then hand each subplot its rows' colours
+        frame_colours = self.get_point_colours(self.df)
+        place_colours = {place: frame_colours[day_order[rows]] for place, rows in place_groups.indices.items()}
+        place_bounds = place_groups[self.y_value_column].agg(['min', 'max'])
         if num_cols is None:
             num_cols = int(np.ceil(num_plots / num_rows))
 
-        # Use SettingsManager for row-based settings
-        mgr = SettingsManager(settings, num_rows)
-
         # Always use A3 landscape size (13.34" × 7.5")
         base_width = mgr.get('figure.fig_width_in')
         base_height = mgr.get('figure.fig_height_in')
 
-        fig, axs = plt.subplots(num_rows, num_cols, figsize=(base_width, base_height), subplot_kw={'polar': True})
+        fig = self._new_figure((base_width, base_height), show_plot)
+        axs = fig.subplots(num_rows, num_cols, subplot_kw={'polar': True})
 
         # Get spacing settings (already row-scaled via SettingsManager)
         adjusted_hspace = mgr.get('subplot.hspace')
@@ -695,7 +943,9 @@ class Visualizer:
         subplot_right = mgr.get('subplot.right')
         wspace = mgr.get('subplot.wspace')
 
-        plt.subplots_adjust(left=subplot_left, right=subplot_right, hspace=adjusted_hspace, wspace=wspace, top=adjusted_top, bottom=adjusted_bottom)
+        fig.subplots_adjust(left=subplot_left, right=subplot_right, hspace=adjusted_hspace, wspace=wspace, top=adjusted_top, bottom=adjusted_bottom)
+        height_scale = mgr.get('subplot.height_scale')
+        width_scale = mgr.get('subplot.width_scale')
 
         for row in range(num_rows):
             for col in range(num_cols):
@@ -710,13 +960,9 @@ class Visualizer:
                     ax = axs[row]
                 if plot_idx < num_plots:
                     place = place_list[plot_idx]
-                    df_place = self.df[self.df[subplot_field] == place].sort_values('day_of_year')
+                    df_place = place_frames[place]
 
                     # Control subplot size using row-scaled settings
-                    pos = ax.get_position()
-                    height_scale = mgr.get('subplot.height_scale')
-                    width_scale = mgr.get('subplot.width_scale')
-
                     if num_rows > 2:
                         # For 3+ rows: calculate size based on allocated space
                         available_height = adjusted_top - adjusted_bottom
@@ -734,11 +980,14 @@ class Visualizer:
                         new_y = center_y - target_height / 2
 
                         ax.set_position([new_x, new_y, target_width, target_height])
-                    else:
+                    elif width_scale != 1.0 or height_scale != 1.0:
                         # For 1-2 rows: expand from default position using scale factors
+                        pos = ax.get_position()
                         new_width = pos.width * width_scale
                         new_height = pos.height * height_scale
                         ax.set_position([pos.x0, pos.y0, new_width, new_height])
+                    # Resolve the final position once, before titles/ticks are added
+                    bbox = ax.get_position()
 
                     if subplot_title_template is not None:
                         base_context = dict(subplot_title_context or {})
@@ -766,7 +1015,16 @@ class Visualizer:
                         subplot_title = f"{place} ({self.first_year}-{self.last_year})"
                     else:
                         subplot_title = f"{place} ({self.first_year})"
-                    self.subplot_polar(df=df_place, ax=ax, cbar=False, title=subplot_title, num_rows=num_rows)
+                    self.subplot_polar(
+                        df=df_place,
+                        ax=ax,
+                        cbar=False,
+                        title=subplot_title,
+                        num_rows=num_rows,
+                        range_bounds=(float(place_bounds.at[place, 'min']), float(place_bounds.at[place, 'max'])),
+                        bbox=bbox,
+                        point_colours=place_colours[place],
+                    )
                 else:
                     ax.axis('off')  # Hide unused subplots
 
@@ -789,9 +1047,11 @@ class Visualizer:
 
         label_fontsize = mgr.get('page.label_fontsize')
         dpi = mgr.get('page.dpi')
-        plt.figtext(0.05, 0.03, credit, verticalalignment='center', horizontalalignment='left', fontsize=label_fontsize)
-        plt.figtext(0.93, 0.03, data_source, verticalalignment='center', horizontalalignment='right', fontsize=label_fontsize)
+        bbox_inches = 'tight' if mgr.get('page.tight_bbox', True) else None
+        fig.text(0.05, 0.03, credit, verticalalignment='center', horizontalalignment='left', fontsize=label_fontsize)
+        fig.text(0.93, 0.03, data_source, verticalalignment='center', horizontalalignment='right', fontsize=label_fontsize)
+        # Save before showing so the file never depends on the interactive window
+        fig.savefig(save_file, dpi=dpi, bbox_inches=bbox_inches)
         if show_plot:
             plt.show()
-        fig.savefig(save_file, dpi=dpi, bbox_inches="tight")
         plt.close(fig)
@@ -10,6 +10,17 @@ from pathlib import Path
 import yaml
 
 
+try:
+    _SAFE_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _SAFE_LOADER = yaml.SafeLoader
+
+
+def _yaml_safe_load(stream):
+    """Load YAML using fastest available safe loader."""
+    return yaml.load(stream, Loader=_SAFE_LOADER) or {}
+
+
 DEFAULT_LOGGING_SETTINGS = {
     'log_file': 'geo.log',
     'console_level': 'WARNING',
@@ -63,7 +74,7 @@ def should_show_cds_warnings() -> bool:
 def _load_logging_settings(config_path: Path) -> dict:
     """Load and validate logging settings from config.yaml."""
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f) or {}
+        config = _yaml_safe_load(f)
 
     logging_config = config.get('logging', {})
     if not isinstance(logging_config, dict):
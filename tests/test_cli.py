@@ -1,7 +1,9 @@
 # Test CLI utilities
 import pytest
+import runpy
 import subprocess
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 from cli import (
     CLIError,
@@ -18,256 +20,247 @@ from cli import (
 from geo_data.cds_base import Location
 
 
-def test_cli_help():
-    result = subprocess.run([sys.executable, '-m', 'geo', '--help'], capture_output=True, text=True)
-    assert result.returncode == 0
-    assert 'usage' in result.stdout.lower() or 'help' in result.stdout.lower()
+def test_cli_help(capsys):
+    with patch('sys.argv', ['geo', '--help']), pytest.raises(SystemExit) as exc_info:
+        runpy.run_module('geo', run_name='__main__')
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert 'usage' in out.lower() or 'help' in out.lower()
 
 
-# Test parse_years function
-def test_parse_years_single_year():
-    start, end = parse_years("2024")
-    assert start == 2024
-    assert end == 2024
+def test_parse_args_help_from_explicit_argv(capsys):
+    with patch('sys.argv', ['geo.py', '--place', 'Austin, TX']), pytest.raises(SystemExit) as exc_info:
+        parse_args(['--help'])
+    assert exc_info.value.code == 0
+    assert 'usage' in capsys.readouterr().out.lower()
 
 
-def test_parse_years_range():
-    start, end = parse_years("2020-2024")
-    assert start == 2020
-    assert end == 2024
+def test_parse_args_explicit_argv_ignores_sys_argv():
+    with patch('sys.argv', ['geo.py', '--place', 'Austin, TX']):
+        args = parse_args(['--years', '2020-2024'])
+    assert args.place is None
+    assert args.years == '2020-2024'
 
 
-def test_parse_years_invalid_format():
-    with pytest.raises(CLIError) as exc_info:
-        parse_years("not-a-year")
-    assert "Invalid --years format" in str(exc_info.value)
+def test_cli_import_defers_data_layer():
+    code = "import sys, cli; print(sorted(m for m in ('pandas', 'xarray', 'cdsapi', 'config_manager') if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.strip() == '[]'
 
 
-def test_parse_years_invalid_range():
-    with pytest.raises(CLIError):
-        parse_years("2020-2024-2025")
+# Test parse_years function
+@pytest.mark.parametrize(
+    "years_str,expected",
+    [
+        ("2024", (2024, 2024)),
+        ("2020-2024", (2020, 2024)),
+        ("2020 - 2025", (2020, 2025)),
+        (" 2024 ", (2024, 2024)),
+        ("+2020", (2020, 2020)),
+        ("\uff12\uff10\uff12\uff14", (2024, 2024)),  # full-width digits
+    ],
+)
+def test_parse_years_valid(years_str, expected):
+    assert parse_years(years_str) == expected
 
 
-def test_parse_years_reversed_range():
-    with pytest.raises(CLIError):
-        parse_years("2025-2020")
+@pytest.mark.parametrize("years_str", ["not-a-year", "2020-2024-2025", "2025-2020", "-2020", "2020 2025", "+ 2020"])
+def test_parse_years_invalid(years_str):
+    with pytest.raises(CLIError, match="Invalid --years format"):
+        parse_years(years_str)
 
 
 # Test parse_args function
 def test_parse_args_default():
-    with patch('sys.argv', ['geo.py']):
-        args = parse_args()
-        assert args.place is None
-        assert args.place_list is None
-        assert args.all is False
-        assert args.show is False
-        assert args.measure == 'noon_temperature'
-        assert args.download_by == 'config'
-        assert args.update_cache is False
+    args = parse_args([])
+    assert args.place is None
+    assert args.place_list is None
+    assert args.all is False
+    assert args.show is False
+    assert args.measure == 'noon_temperature'
+    assert args.download_by == 'config'
+    assert args.update_cache is False
+    assert args.workers == 1
+
+
+def test_parse_args_reuses_parser_but_returns_fresh_namespaces():
+    from cli import _build_parser
+
+    first = parse_args(['--place', 'Austin, TX'])
+    hits_before = _build_parser.cache_info().hits
+    first.place = 'changed'
+    second = parse_args(['--place', 'Austin, TX'])
+
+    assert _build_parser.cache_info().hits == hits_before + 1
+    assert second is not first
+    assert second.place == 'Austin, TX'
 
 
 def test_parse_args_with_place():
-    with patch('sys.argv', ['geo.py', '--place', 'Austin, TX']):
-        args = parse_args()
-        assert args.place == 'Austin, TX'
-        assert args.place_list is None
-        assert args.all is False
+    args = parse_args(['--place', 'Austin, TX'])
+    assert args.place == 'Austin, TX'
+    assert args.place_list is None
+    assert args.all is False
 
 
 def test_parse_args_with_place_no_value_uses_sentinel():
-    with patch('sys.argv', ['geo.py', '--place']):
-        args = parse_args()
-        assert args.place == PLACE_DEFAULT_SENTINEL
+    args = parse_args(['--place'])
+    assert args.place == PLACE_DEFAULT_SENTINEL
 
 
 def test_parse_args_with_place_all_value():
-    with patch('sys.argv', ['geo.py', '--place', 'all']):
-        args = parse_args()
-        assert args.place == 'all'
+    args = parse_args(['--place', 'all'])
+    assert args.place == 'all'
 
 
 def test_parse_args_with_place_list():
-    with patch('sys.argv', ['geo.py', '--list', 'preferred']):
-        args = parse_args()
-        assert args.place_list == 'preferred'
-        assert args.place is None
-        assert args.all is False
+    args = parse_args(['--list', 'preferred'])
+    assert args.place_list == 'preferred'
+    assert args.place is None
+    assert args.all is False
 
 
 def test_parse_args_with_place_list_short_option():
-    with patch('sys.argv', ['geo.py', '-l', 'preferred']):
-        args = parse_args()
-        assert args.place_list == 'preferred'
-        assert args.place is None
-        assert args.all is False
+    args = parse_args(['-l', 'preferred'])
+    assert args.place_list == 'preferred'
+    assert args.place is None
+    assert args.all is False
 
 
 def test_parse_args_with_list_all_alias():
-    with patch('sys.argv', ['geo.py', '--list', 'all']):
-        args = parse_args()
-        assert args.place_list == 'all'
-        assert args.all is False
+    args = parse_args(['--list', 'all'])
+    assert args.place_list == 'all'
+    assert args.all is False
 
 
 def test_parse_args_with_list_places_short_option():
-    with patch('sys.argv', ['geo.py', '-Lp']):
-        args = parse_args()
-        assert args.list_places is True
+    args = parse_args(['-Lp'])
+    assert args.list_places is True
 
 
 def test_parse_args_with_list_places_long_option():
-    with patch('sys.argv', ['geo.py', '--list-places']):
-        args = parse_args()
-        assert args.list_places is True
+    args = parse_args(['--list-places'])
+    assert args.list_places is True
 
 
 def test_parse_args_with_list_lists_short_option():
-    with patch('sys.argv', ['geo.py', '-Ll']):
-        args = parse_args()
-        assert args.list_lists is True
+    args = parse_args(['-Ll'])
+    assert args.list_lists is True
 
 
 def test_parse_args_with_list_lists_long_option():
-    with patch('sys.argv', ['geo.py', '--list-lists']):
-        args = parse_args()
-        assert args.list_lists is True
+    args = parse_args(['--list-lists'])
+    assert args.list_lists is True
 
 
 def test_parse_args_with_legacy_list_places_short_option():
-    with patch('sys.argv', ['geo.py', '-L']):
-        args = parse_args()
-        assert args.list_places_legacy is True
+    args = parse_args(['-L'])
+    assert args.list_places_legacy is True
 
 
 def test_parse_args_with_cache_summary_flag():
-    with patch('sys.argv', ['geo.py', '--cache-summary']):
-        args = parse_args()
-        assert args.cache_summary is True
-        assert args.rebuild_cache_summary is False
+    args = parse_args(['--cache-summary'])
+    assert args.cache_summary is True
+    assert args.rebuild_cache_summary is False
 
 
 def test_parse_args_with_rebuild_cache_summary_flag():
-    with patch('sys.argv', ['geo.py', '--rebuild-cache-summary']):
-        args = parse_args()
-        assert args.rebuild_cache_summary is True
+    args = parse_args(['--rebuild-cache-summary'])
+    assert args.rebuild_cache_summary is True
 
 
 def test_parse_args_with_all():
-    with patch('sys.argv', ['geo.py', '--all']):
-        args = parse_args()
-        assert args.all is True
-        assert args.place is None
-        assert args.place_list is None
+    args = parse_args(['--all'])
+    assert args.all is True
+    assert args.place is None
+    assert args.place_list is None
 
 
 def test_parse_args_with_custom_location():
-    with patch('sys.argv', ['geo.py', '--place', 'Custom', '--lat', '40.0', '--lon', '-73.0', '--tz', 'America/New_York']):
-        args = parse_args()
-        assert args.place == 'Custom'
-        assert args.lat == 40.0
-        assert args.lon == -73.0
-        assert args.tz == 'America/New_York'
+    args = parse_args(['--place', 'Custom', '--lat', '40.0', '--lon', '-73.0', '--tz', 'America/New_York'])
+    assert args.place == 'Custom'
+    assert args.lat == 40.0
+    assert args.lon == -73.0
+    assert args.tz == 'America/New_York'
 
 
 def test_parse_args_with_years():
-    with patch('sys.argv', ['geo.py', '--years', '2020-2024']):
-        args = parse_args()
-        assert args.years == '2020-2024'
+    args = parse_args(['--years', '2020-2024'])
+    assert args.years == '2020-2024'
 
 
 def test_parse_args_with_show():
-    with patch('sys.argv', ['geo.py', '--show']):
-        args = parse_args()
-        assert args.show is True
-
-
-def test_parse_args_with_measure():
-    with patch('sys.argv', ['geo.py', '--measure', 'daily_precipitation']):
-        args = parse_args()
-        assert args.measure == 'daily_precipitation'
-
-
-def test_parse_args_with_measure_short_option():
-    with patch('sys.argv', ['geo.py', '-m', 'daily_precipitation']):
-        args = parse_args()
-        assert args.measure == 'daily_precipitation'
-
-
-def test_parse_args_with_solar_measure():
-    with patch('sys.argv', ['geo.py', '--measure', 'daily_solar_radiation_energy']):
-        args = parse_args()
-        assert args.measure == 'daily_solar_radiation_energy'
-
-
-def test_parse_args_with_temp_alias():
-    with patch('sys.argv', ['geo.py', '--measure', 'temp']):
-        args = parse_args()
-        assert args.measure == 'noon_temperature'
-
-
-def test_parse_args_with_temperature_alias():
-    with patch('sys.argv', ['geo.py', '--measure', 'temperature']):
-        args = parse_args()
-        assert args.measure == 'noon_temperature'
-
-
-def test_parse_args_with_precipitation_alias():
-    with patch('sys.argv', ['geo.py', '--measure', 'precipitation']):
-        args = parse_args()
-        assert args.measure == 'daily_precipitation'
-
-
-def test_parse_args_with_solar_alias():
-    with patch('sys.argv', ['geo.py', '--measure', 'solar']):
-        args = parse_args()
-        assert args.measure == 'daily_solar_radiation_energy'
+    args = parse_args(['--show'])
+    assert args.show is True
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        (['--measure', 'daily_precipitation'], 'daily_precipitation'),
+        (['-m', 'daily_precipitation'], 'daily_precipitation'),
+        (['--measure', 'daily_solar_radiation_energy'], 'daily_solar_radiation_energy'),
+        (['--measure', 'temp'], 'noon_temperature'),
+        (['--measure', 'temperature'], 'noon_temperature'),
+        (['--measure', 'precipitation'], 'daily_precipitation'),
+        (['--measure', 'solar'], 'daily_solar_radiation_energy'),
+    ],
+)
+def test_parse_args_with_measure(argv, expected):
+    args = parse_args(argv)
+    assert args.measure == expected
 
 
 def test_parse_args_with_measure_all():
-    with patch('sys.argv', ['geo.py', '-m', 'all']):
-        args = parse_args()
-        assert args.measures == [
-            'noon_temperature',
-            'daily_precipitation',
-            'daily_solar_radiation_energy',
-        ]
-        assert args.measure == 'noon_temperature'
+    args = parse_args(['-m', 'all'])
+    assert args.measures == [
+        'noon_temperature',
+        'daily_precipitation',
+        'daily_solar_radiation_energy',
+    ]
+    assert args.measure == 'noon_temperature'
 
 
 def test_parse_args_with_multiple_measures_csv():
-    with patch('sys.argv', ['geo.py', '-m', 'temp,solar']):
-        args = parse_args()
-        assert args.measures == ['noon_temperature', 'daily_solar_radiation_energy']
+    args = parse_args(['-m', 'temp,solar'])
+    assert args.measures == ['noon_temperature', 'daily_solar_radiation_energy']
 
 
 def test_parse_args_with_measure_all_mixed_raises():
-    with patch('sys.argv', ['geo.py', '-m', 'all,temp']):
-        with pytest.raises(CLIError):
-            parse_args()
+    with pytest.raises(CLIError):
+        parse_args(['-m', 'all,temp'])
 
 
 def test_parse_args_with_download_by_month():
-    with patch('sys.argv', ['geo.py', '--download-by', 'month']):
-        args = parse_args()
-        assert args.download_by == 'month'
+    args = parse_args(['--download-by', 'month'])
+    assert args.download_by == 'month'
 
 
 def test_parse_args_with_download_by_compare():
-    with patch('sys.argv', ['geo.py', '--download-by', 'compare']):
-        args = parse_args()
-        assert args.download_by == 'compare'
+    args = parse_args(['--download-by', 'compare'])
+    assert args.download_by == 'compare'
 
 
 def test_parse_args_with_update_cache_long_form():
-    with patch('sys.argv', ['geo.py', '--update-cache']):
-        args = parse_args()
-        assert args.update_cache is True
+    args = parse_args(['--update-cache'])
+    assert args.update_cache is True
 
 
 def test_parse_args_with_update_cache_short_form():
-    with patch('sys.argv', ['geo.py', '-u']):
-        args = parse_args()
-        assert args.update_cache is True
+    args = parse_args(['-u'])
+    assert args.update_cache is True
+
+
+def test_parse_args_with_workers():
+    args = parse_args(['--workers', '4'])
+    assert args.workers == 4
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_parse_args_with_invalid_workers_raises(value):
+    with pytest.raises(CLIError, match="--workers"):
+        parse_args(['--workers', value])
 
 
 def test_parse_args_runtime_paths_from_custom_config(tmp_path):
@@ -280,12 +273,11 @@ def test_parse_args_runtime_paths_from_custom_config(tmp_path):
         "  settings_file: alt/settings.yaml\n"
     )
 
-    with patch('sys.argv', ['geo.py', '--config', str(config_file)]):
-        args = parse_args()
-        assert str(args.cache_dir) == 'alt_cache'
-        assert str(args.data_cache_dir) == 'alt_data'
-        assert str(args.out_dir) == 'alt_out'
-        assert str(args.settings) == 'alt/settings.yaml'
+    args = parse_args(['--config', str(config_file)])
+    assert str(args.cache_dir) == 'alt_cache'
+    assert str(args.data_cache_dir) == 'alt_data'
+    assert str(args.out_dir) == 'alt_out'
+    assert str(args.settings) == 'alt/settings.yaml'
 
 
 def test_validate_measure_support_default_ok():
@@ -320,117 +312,93 @@ def test_validate_measures_support_invalid_raises():
 
 
 def test_parse_args_with_colour_mode():
-    with patch('sys.argv', ['geo.py', '--colour-mode', 'year']):
-        args = parse_args()
-        assert args.colour_mode == 'year'
+    args = parse_args(['--colour-mode', 'year'])
+    assert args.colour_mode == 'year'
 
 
 def test_parse_args_with_color_mode_alias():
-    with patch('sys.argv', ['geo.py', '--color-mode', 'year']):
-        args = parse_args()
-        assert args.colour_mode == 'year'
+    args = parse_args(['--color-mode', 'year'])
+    assert args.colour_mode == 'year'
 
 
 def test_parse_args_invalid_argument_hint_for_start_year():
-    with patch('sys.argv', ['geo.py', '--start-year', '2025']):
-        with pytest.raises(CLIError) as exc_info:
-            parse_args()
+    with pytest.raises(CLIError) as exc_info:
+        parse_args(['--start-year', '2025'])
     assert "--years" in str(exc_info.value)
 
 
 def test_parse_args_rejects_legacy_colour_mode_temperature():
-    with patch('sys.argv', ['geo.py', '--colour-mode', 'temperature']):
-        with pytest.raises(CLIError) as exc_info:
-            parse_args()
+    with pytest.raises(CLIError) as exc_info:
+        parse_args(['--colour-mode', 'temperature'])
     assert "invalid choice" in str(exc_info.value)
 
 
 # Test get_place_list function
-def test_get_place_list_default():
-    places = {
+def _args(**overrides):
+    return SimpleNamespace(**{'all': False, 'place_list': None, 'place': None, 'lat': None, 'lon': None, 'tz': None, **overrides})
+
+
+@pytest.fixture(scope='module')
+def austin_cambridge_places():
+    return {
         'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
         'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
     }
+
+
+@pytest.fixture(scope='module')
+def austin_cambridge_bangalore_places(austin_cambridge_places):
+    return {
+        **austin_cambridge_places,
+        'Bangalore': Location(name='Bangalore', lat=12.97, lon=77.59, tz='Asia/Kolkata'),
+    }
+
+
+def test_get_place_list_default(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {}
 
     # Mock args with no place selection
-    class Args:
-        all = False
-        place_list = None
-        place = None
-        lat = None
-        lon = None
-        tz = None
-
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    args = _args()
+
+    result, list_name = get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert len(result) == 1
     assert result[0].name == 'Austin, TX'
     assert list_name is None
 
 
-def test_get_place_list_all():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-    }
+def test_get_place_list_all(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {}
 
-    class Args:
-        all = True
-        place_list = None
-        place = None
-        lat = None
-        lon = None
-        tz = None
+    args = _args(all=True)
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert len(result) == 2
     assert set(p.name for p in result) == {'Austin, TX', 'Cambridge, MA'}
     assert list_name == 'all'
 
 
-def test_get_place_list_all_alias_from_list():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-    }
+def test_get_place_list_all_alias_from_list(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {'default': ['Austin, TX']}
 
-    class Args:
-        all = False
-        place_list = 'all'
-        place = None
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place_list='all')
 
     with pytest.raises(CLIError):
-        get_place_list(Args(), places, default_place, place_lists)
+        get_place_list(args, austin_cambridge_places, default_place, place_lists)
 
 
-def test_get_place_runs_all_from_list_expands_to_each_list():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-    }
+def test_get_place_runs_all_from_list_expands_to_each_list(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {
         'alpha': ['Austin, TX'],
         'beta': ['Cambridge, MA'],
     }
 
-    class Args:
-        all = False
-        place_list = 'all'
-        place = None
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place_list='all')
 
-    runs = get_place_runs(Args(), places, default_place, place_lists)
+    runs = get_place_runs(args, austin_cambridge_places, default_place, place_lists)
     assert len(runs) == 2
     assert runs[0][1] == 'alpha'
     assert [p.name for p in runs[0][0]] == ['Austin, TX']
@@ -438,92 +406,63 @@ def test_get_place_runs_all_from_list_expands_to_each_list():
     assert [p.name for p in runs[1][0]] == ['Cambridge, MA']
 
 
-def test_get_place_list_place_all_returns_all_places():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-    }
+def test_get_place_list_place_all_returns_all_places(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {}
 
-    class Args:
-        all = False
-        place_list = None
-        place = 'all'
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place='all')
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert len(result) == 2
     assert set(p.name for p in result) == {'Austin, TX', 'Cambridge, MA'}
     assert list_name == 'all'
 
 
-def test_get_place_list_place_no_value_uses_default_place():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-    }
+def test_get_place_list_place_no_value_uses_default_place(austin_cambridge_places):
     default_place = 'Cambridge, MA'
     place_lists = {}
 
-    class Args:
-        all = False
-        place_list = None
-        place = PLACE_DEFAULT_SENTINEL
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place=PLACE_DEFAULT_SENTINEL)
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert len(result) == 1
     assert result[0].name == 'Cambridge, MA'
     assert list_name is None
 
 
-def test_get_place_list_place_list():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
-        'Bangalore': Location(name='Bangalore', lat=12.97, lon=77.59, tz='Asia/Kolkata'),
-    }
+def test_get_place_list_place_list(austin_cambridge_bangalore_places):
     default_place = 'Austin, TX'
     place_lists = {
         'preferred': ['Austin, TX', 'Bangalore']
     }
 
-    class Args:
-        all = False
-        place_list = 'preferred'
-        place = None
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place_list='preferred')
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, austin_cambridge_bangalore_places, default_place, place_lists)
     assert len(result) == 2
     assert set(p.name for p in result) == {'Austin, TX', 'Bangalore'}
     assert list_name == 'preferred'
 
 
-def test_get_place_list_single_place():
-    places = {
-        'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago'),
-        'Cambridge, MA': Location(name='Cambridge, MA', lat=42.37, lon=-71.11, tz='America/New_York'),
+def test_get_place_list_place_list_keeps_order_and_skips_unknown_names(austin_cambridge_bangalore_places):
+    place_lists = {
+        'preferred': ['Bangalore', 'Nowhere', 'Austin, TX']
     }
+
+    args = _args(place_list='preferred')
+
+    result, list_name = get_place_list(args, austin_cambridge_bangalore_places, 'Austin, TX', place_lists)
+    assert [p.name for p in result] == ['Bangalore', 'Austin, TX']
+    assert list_name == 'preferred'
+
+
+def test_get_place_list_single_place(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {}
 
-    class Args:
-        all = False
-        place_list = None
-        place = 'Cambridge, MA'
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place='Cambridge, MA')
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert len(result) == 1
     assert result[0].name == 'Cambridge, MA'
     assert list_name is None
@@ -534,15 +473,9 @@ def test_get_place_list_custom_location():
     default_place = 'Austin, TX'
     place_lists = {}
 
-    class Args:
-        all = False
-        place_list = None
-        place = 'Custom City'
-        lat = 40.0
-        lon = -73.0
-        tz = 'America/New_York'
+    args = _args(place='Custom City', lat=40.0, lon=-73.0, tz='America/New_York')
 
-    result, list_name = get_place_list(Args(), places, default_place, place_lists)
+    result, list_name = get_place_list(args, places, default_place, place_lists)
     assert len(result) == 1
     assert result[0].name == 'Custom City'
     assert result[0].lat == 40.0
@@ -551,102 +484,67 @@ def test_get_place_list_custom_location():
     assert list_name is None
 
 
-def test_get_place_list_invalid_place_list():
-    places = {'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago')}
+def test_get_place_list_invalid_place_list(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {'preferred': ['Austin, TX']}
 
-    class Args:
-        all = False
-        place_list = 'nonexistent'
-        place = None
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place_list='nonexistent')
 
     with pytest.raises(CLIError) as exc_info:
-        get_place_list(Args(), places, default_place, place_lists)
+        get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert "Unknown place list" in str(exc_info.value)
 
 
-def test_get_place_list_invalid_place_no_coords():
-    places = {'Austin, TX': Location(name='Austin, TX', lat=30.27, lon=-97.74, tz='America/Chicago')}
+def test_get_place_list_invalid_place_no_coords(austin_cambridge_places):
     default_place = 'Austin, TX'
     place_lists = {}
 
-    class Args:
-        all = False
-        place_list = None
-        place = 'Unknown Place'
-        lat = None
-        lon = None
-        tz = None
+    args = _args(place='Unknown Place')
 
     with pytest.raises(CLIError) as exc_info:
-        get_place_list(Args(), places, default_place, place_lists)
+        get_place_list(args, austin_cambridge_places, default_place, place_lists)
     assert "Unknown place" in str(exc_info.value)
 
 
 # Test parse_grid function
-def test_parse_grid_valid():
-    assert parse_grid("4x3") == (3, 4)  # 4 cols, 3 rows
-
-
-def test_parse_grid_valid_uppercase():
-    assert parse_grid("5X4") == (4, 5)  # 5 cols, 4 rows
-
-
-def test_parse_grid_none():
-    assert parse_grid(None) is None
-
-
-def test_parse_grid_invalid_no_x():
-    with pytest.raises(CLIError):
-        parse_grid("43")
-
-
-def test_parse_grid_invalid_too_many_parts():
-    with pytest.raises(CLIError):
-        parse_grid("4x3x2")
-
-
-def test_parse_grid_invalid_non_numeric():
-    with pytest.raises(CLIError):
-        parse_grid("axb")
-
+@pytest.mark.parametrize(
+    "grid_str,expected",
+    [
+        ("4x3", (3, 4)),  # 4 cols, 3 rows
+        ("5X4", (4, 5)),  # 5 cols, 4 rows
+        ("4 x 3", (3, 4)),
+        ("+4x+3", (3, 4)),
+        (None, None),
+    ],
+)
+def test_parse_grid_valid(grid_str, expected):
+    assert parse_grid(grid_str) == expected
 
-def test_parse_grid_invalid_zero():
-    with pytest.raises(CLIError):
-        parse_grid("0x3")
 
-
-def test_parse_grid_invalid_negative():
-    with pytest.raises(CLIError):
-        parse_grid("4x-3")
+@pytest.mark.parametrize("grid_str", ["43", "4x3x2", "axb", "0x3", "4x-3"])
+def test_parse_grid_invalid(grid_str):
+    with pytest.raises(CLIError, match="Invalid grid format"):
+        parse_grid(grid_str)
 
 
 # Test CLI with --grid argument
 def test_parse_args_with_grid():
-    with patch('sys.argv', ['geo.py', '--grid', '4x3']):
-        args = parse_args()
-        assert args.grid == '4x3'
+    args = parse_args(['--grid', '4x3'])
+    assert args.grid == '4x3'
 
 
 def test_parse_args_grid_default():
-    with patch('sys.argv', ['geo.py']):
-        args = parse_args()
-        assert args.grid is None
+    args = parse_args([])
+    assert args.grid is None
 
 
 def test_parse_args_rejects_list_years_short_option():
     """Removed -ly shorthand should no longer map to a list-years flag."""
-    with patch('sys.argv', ['geo.py', '-ly']):
-        args = parse_args()
-        assert args.place_list == 'y'
+    args = parse_args(['-ly'])
+    assert args.place_list == 'y'
 
 
 def test_parse_args_rejects_list_years_long_option():
     """Removed --list-years option should now raise a CLI error."""
-    with patch('sys.argv', ['geo.py', '--list-years']):
-        with pytest.raises(CLIError):
-            parse_args()
+    with pytest.raises(CLIError):
+        parse_args(['--list-years'])
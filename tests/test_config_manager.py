@@ -4,6 +4,8 @@ Tests for config_manager module.
 Tests configuration file management, place loading, and config saving.
 """
 
+import os
+
 import yaml
 
 from config_manager import load_places, save_config
@@ -292,3 +294,30 @@ def test_load_places_from_external_places_file(tmp_path):
     assert default_place == "External City"
     assert "External City" in places
     assert place_lists["sample"] == ["External City"]
+
+
+def test_load_places_reparses_only_changed_files(tmp_path, monkeypatch):
+    """Repeated loads reuse parsed YAML until the places file changes."""
+    import geo_core.config as core_config
+
+    config_file = tmp_path / "config.yaml"
+    places_file = tmp_path / "places.yaml"
+    config_file.write_text("places_file: places.yaml\n")
+    places_file.write_text("all_places:\n  - {name: \"First\", lat: 1.0, lon: 2.0}\n")
+    parses = []
+    real_safe_load = core_config._yaml_safe_load
+    monkeypatch.setattr(core_config, "_yaml_safe_load", lambda f: parses.append(f.name) or real_safe_load(f))
+
+    places, _, _ = load_places(config_file)
+    places.clear()
+    places, _, _ = load_places(config_file)
+    assert list(places) == ["First"]
+    assert len(parses) == 2
+
+    places_file.write_text("all_places:\n  - {name: \"Second\", lat: 1.0, lon: 2.0}\n")
+    stat = places_file.stat()
+    os.utime(places_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    places, _, _ = load_places(config_file)
+    assert list(places) == ["Second"]
+    assert len(parses) == 3
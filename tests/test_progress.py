@@ -1,10 +1,48 @@
 """Tests for progress reporting system."""
 
+import pytest
+
 from progress import (
     ConsoleProgressHandler,
 )
 
 
+@pytest.fixture(autouse=True)
+def _force_live_progress(monkeypatch):
+    """Captured stdout is not a TTY; draw live bars so each event's output can be checked."""
+    monkeypatch.setenv(ConsoleProgressHandler.FORCE_PROGRESS_ENV, "1")
+
+
+class _RecordingStream:
+    """Stand-in for sys.stdout that records each write call separately."""
+
+    def __init__(self, tty: bool = False):
+        self.writes: list[str] = []
+        self._tty = tty
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._tty
+
+
+@pytest.fixture
+def recording_stdout(monkeypatch):
+    """Replace sys.stdout with a recorder; pass tty=True for a terminal-like stream."""
+    import sys
+
+    def _install(tty: bool = False) -> _RecordingStream:
+        stream = _RecordingStream(tty)
+        monkeypatch.setattr(sys, "stdout", stream)
+        return stream
+
+    return _install
+
+
 def test_console_progress_handler_output(capsys):
     """Test console progress handler output."""
     handler = ConsoleProgressHandler()
@@ -80,3 +118,153 @@ def test_console_progress_handler_renders_on_location_start(capsys):
     assert "Place 1/3" in captured.out
     assert "Austin, TX" in captured.out
     assert "Year 0/2" in captured.out
+
+
+def test_console_progress_handler_bars_match_progress_fraction(capsys):
+    """Precomputed bars should render the same fill as the progress fraction."""
+    handler = ConsoleProgressHandler()
+
+    handler.on_month_complete("Austin, TX", 2024, 6, 6, 12)
+    handler.on_stage_progress("Plot output", "batch 2", 2, 2)
+
+    captured = capsys.readouterr()
+    assert "Place" not in captured.out
+    assert "[░░░░░░░░░░░░] 0%" in captured.out
+    assert "[█████░░░░░] 50%" in captured.out
+    assert "[" + "█" * 16 + "] 100%" in captured.out
+
+
+def test_console_progress_handler_clamps_counts_above_total(capsys):
+    """Counts past the total draw a full bar instead of raising inside a progress callback."""
+    handler = ConsoleProgressHandler()
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=2)
+    handler.on_year_complete("Austin, TX", 2024, 3, 2)
+    handler.on_month_complete("Austin, TX", 2024, 13, 13, 12)
+
+    captured = capsys.readouterr()
+    assert "Year 2/2 (2024): [" + "█" * 12 + "] 100%" in captured.out
+    assert "Month 12/12 (13): [" + "█" * 10 + "] 100%" in captured.out
+
+
+def test_console_progress_handler_clamps_negative_counts(capsys):
+    """Negative counts draw an empty bar rather than wrapping to the end of the segments."""
+    handler = ConsoleProgressHandler()
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=2)
+    handler.on_year_start("Austin, TX", 2024, 0, 2)
+    handler.on_month_start("Austin, TX", 2024, 1, 0, 12)
+
+    captured = capsys.readouterr()
+    assert "Year -1/2" not in captured.out
+    assert "Year 0/2 (2024): [░░░░░░░░░░░░] 0%" in captured.out
+    assert "Month 0/12 (01): [░░░░░░░░░░] 0%" in captured.out
+    assert "100%" not in captured.out
+
+
+def test_console_progress_handler_throttles_intermediate_renders(capsys):
+    """Rapid updates that leave the bars unchanged should be throttled."""
+    ticks = [0.0, 0.01, 0.02, 0.03, 0.04]
+    handler = ConsoleProgressHandler()
+    handler._clock = lambda: ticks.pop(0) if ticks else 1.0
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=1)
+    handler.on_month_start("Austin, TX", 2024, 1, 1, 12)
+    handler.on_month_start("Austin, TX", 2024, 2, 2, 12)
+    assert capsys.readouterr().out.count("\r") == 2
+
+    handler.on_month_complete("Austin, TX", 2024, 2, 2, 12)
+    handler.on_year_complete("Austin, TX", 2024, 1, 1)
+
+    captured = capsys.readouterr()
+    assert captured.out.count("\r") == 2
+    assert "(02)" in captured.out
+    assert "Year 1/1" in captured.out
+
+
+def test_console_progress_handler_flushes_throttled_line_on_location_complete(capsys):
+    """A throttled update should still be written before the location's newline."""
+    handler = ConsoleProgressHandler()
+    handler._clock = lambda: 0.0
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=1)
+    handler.on_month_start("Austin, TX", 2024, 1, 1, 12)
+    handler.on_month_start("Austin, TX", 2024, 2, 2, 12)
+    assert "(02)" not in capsys.readouterr().out
+
+    handler.on_location_complete("Austin, TX")
+
+    assert capsys.readouterr().out.endswith("(02): [░░░░░░░░░░] 8%\n")
+
+
+def test_console_progress_handler_writes_pending_line_and_newline_together(recording_stdout):
+    """Completing a location should emit the pending line and newline in one write."""
+    writes = recording_stdout().writes
+    handler = ConsoleProgressHandler()
+    handler._clock = lambda: 0.0
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=1)
+    handler.on_month_start("Austin, TX", 2024, 1, 1, 12)
+    handler.on_month_start("Austin, TX", 2024, 2, 2, 12)
+    handler.on_location_complete("Austin, TX")
+
+    assert len(writes) == 3
+    assert writes[-1].startswith("\r") and writes[-1].endswith("8%\n")
+
+
+def test_root_progress_module_reexports_core_handler():
+    """Root progress module should re-export the single geo_core implementation."""
+    import geo_core.progress
+
+    assert ConsoleProgressHandler is geo_core.progress.ConsoleProgressHandler
+
+
+def test_console_progress_handler_defers_year_start_matching_previous_bar(capsys):
+    """A year start right after the previous year completes should not redraw an identical bar."""
+    handler = ConsoleProgressHandler()
+    handler._clock = lambda: 0.0
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=2)
+    handler.on_year_complete("Austin, TX", 2023, 1, 2)
+    capsys.readouterr()
+
+    handler.on_year_start("Austin, TX", 2024, 2, 2)
+    assert capsys.readouterr().out == ""
+
+    handler.on_location_complete("Austin, TX")
+    assert "Year 1/2 (2024)" in capsys.readouterr().out
+
+
+def test_console_progress_handler_non_tty_writes_one_line_per_location(monkeypatch, capsys):
+    """Without a terminal, only the final state of each location should be written."""
+    monkeypatch.delenv(ConsoleProgressHandler.FORCE_PROGRESS_ENV)
+    handler = ConsoleProgressHandler()
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=1)
+    handler.on_year_start("Austin, TX", 2024, 1, 1)
+    handler.on_month_complete("Austin, TX", 2024, 12, 12, 12)
+    handler.on_year_complete("Austin, TX", 2024, 1, 1)
+    assert capsys.readouterr().out == ""
+
+    handler.on_location_complete("Austin, TX")
+
+    out = capsys.readouterr().out
+    assert "\r" not in out
+    assert out.count("\n") == 1
+    assert "Year 1/1 (2024)" in out and "100%" in out
+
+
+def test_console_progress_handler_redraw_after_log_output_writes_full_line(recording_stdout):
+    """Re-sent year starts (after log lines) must redraw the whole line, not a cursor-relative tail."""
+    writes = recording_stdout(tty=True).writes
+    ticks = iter([0.0, 1.0, 2.0])
+    handler = ConsoleProgressHandler()
+    handler._clock = lambda: next(ticks)
+
+    handler.on_location_start("Austin, TX", 1, 1, total_years=1)
+    handler.on_year_start("Austin, TX", 2024, 1, 1)
+    handler.on_year_start("Austin, TX", 2024, 1, 1)
+
+    assert len(writes) == 3
+    assert writes[1] == writes[2]
+    assert writes[2].startswith("\r  Place 1/1 Austin, TX")